@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of Google Translate results shared by the translation scripts.
+"""
+
+import hashlib
+import sqlite3
+import time
+
+CACHE_DB = 'translation_cache.db'
+
+# Texts Google could not translate are retried once this many days have passed
+UNTRANSLATABLE_RETRY_DAYS = 30
+
+_connection = None
+
+def _connect(db_file=CACHE_DB):
+    """Open the cache database once per process"""
+
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(db_file)
+        _connection.execute('PRAGMA journal_mode=WAL')
+        _connection.execute(
+            'CREATE TABLE IF NOT EXISTS trans ('
+            'hash TEXT, dest TEXT, text TEXT, ts INTEGER, PRIMARY KEY (hash, dest))'
+        )
+        _connection.execute(
+            'CREATE TABLE IF NOT EXISTS untranslatable ('
+            'hash TEXT, dest TEXT, ts INTEGER, PRIMARY KEY (hash, dest))'
+        )
+    return _connection
+
+def text_hash(text):
+    """Cache key for a source text, ignoring case and surrounding whitespace"""
+
+    return hashlib.md5(text.strip().lower().encode('utf-8')).hexdigest()
+
+def get_cached(h, dest='en'):
+    """Return the cached translation for a hash, or None on a miss"""
+
+    row = _connect().execute('SELECT text FROM trans WHERE hash = ? AND dest = ?', (h, dest)).fetchone()
+    return row[0] if row else None
+
+def put_many(items, dest='en'):
+    """Store (hash, translation) pairs in a single transaction"""
+
+    ts = int(time.time())
+    conn = _connect()
+    with conn:
+        conn.executemany(
+            'INSERT OR REPLACE INTO trans (hash, dest, text, ts) VALUES (?, ?, ?, ?)',
+            [(h, dest, text, ts) for h, text in items]
+        )
+        conn.executemany(
+            'DELETE FROM untranslatable WHERE hash = ? AND dest = ?',
+            [(h, dest) for h, _ in items]
+        )
+
+def put_cached(h, dest, text):
+    """Store a single translation"""
+
+    put_many([(h, text)], dest)
+
+def mark_untranslatable(hashes, dest='en'):
+    """Remember texts whose translation failed validation"""
+
+    ts = int(time.time())
+    conn = _connect()
+    with conn:
+        conn.executemany(
+            'INSERT OR REPLACE INTO untranslatable (hash, dest, ts) VALUES (?, ?, ?)',
+            [(h, dest, ts) for h in hashes]
+        )
+
+def known_untranslatable(hashes, dest='en', retry_days=UNTRANSLATABLE_RETRY_DAYS):
+    """Return the subset of hashes that failed too recently to be retried"""
+
+    cutoff = int(time.time()) - retry_days * 86400
+    conn = _connect()
+    hashes = list(hashes)
+    found = set()
+    # Stay below SQLite's limit on query parameters
+    for i in range(0, len(hashes), 500):
+        chunk = hashes[i:i + 500]
+        rows = conn.execute(
+            f'SELECT hash FROM untranslatable WHERE dest = ? AND ts >= ? AND hash IN ({",".join("?" * len(chunk))})',
+            [dest, cutoff, *chunk]
+        )
+        found.update(row[0] for row in rows)
+    return found
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Indonesian to English dictionary for common stopwords, shared by the translation scripts
+"""
+
+from types import MappingProxyType
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Predefined Indonesian to English dictionary for common stopwords
+INDONESIAN_ENGLISH_DICT = {
+    # Pronouns
+    'saya': 'i', 'aku': 'i', 'kamu': 'you', 'anda': 'you', 'dia': 'he', 'ia': 'he',
+    'mereka': 'they', 'kita': 'we', 'kami': 'we', 'kalian': 'you',
+    
+    # Common function words
+    'yang': 'which', 'dengan': 'with', 'untuk': 'for', 'dari': 'from', 'pada': 'on',
+    'dalam': 'in', 'oleh': 'by', 'ke': 'to', 'di': 'at', 'akan': 'will',
+    'sudah': 'already', 'sedang': 'being', 'masih': 'still', 'belum': 'not yet',
+    'tidak': 'not', 'bukan': 'not', 'jangan': 'do not', 'juga': 'also',
+    'hanya': 'only', 'saja': 'just', 'pula': 'also', 'lagi': 'again',
+    
+    # Conjunctions
+    'dan': 'and', 'atau': 'or', 'tetapi': 'but', 'karena': 'because',
+    'jika': 'if', 'ketika': 'when', 'sementara': 'while', 'sebelum': 'before',
+    'sesudah': 'after', 'sampai': 'until', 'sejak': 'since',
+    
+    # Demonstratives
+    'ini': 'this', 'itu': 'that', 'begini': 'like this', 'begitu': 'like that',
+    'demikian': 'thus', 'seperti': 'like', 'sama': 'same',
+    
+    # Question words
+    'apa': 'what', 'siapa': 'who', 'dimana': 'where', 'kemana': 'where to',
+    'kapan': 'when', 'mengapa': 'why', 'kenapa': 'why', 'bagaimana': 'how',
+    'berapa': 'how many', 'mana': 'which',
+    
+    # Adverbs
+    'sangat': 'very', 'banget': 'very', 'sekali': 'very', 'agak': 'quite',
+    'cukup': 'enough', 'terlalu': 'too', 'lebih': 'more', 'paling': 'most',
+    'kurang': 'less', 'hampir': 'almost', 'selalu': 'always', 'sering': 'often',
+    'kadang': 'sometimes', 'jarang': 'rarely', 'pernah': 'ever', 'belum pernah': 'never',
+    
+    # Modal verbs
+    'bisa': 'can', 'dapat': 'can', 'mau': 'want', 'ingin': 'want',
+    'harus': 'must', 'perlu': 'need', 'boleh': 'may', 'seharusnya': 'should',
+    
+    # Common particles
+    'lah': '', 'kah': '', 'pun': '', 'sih': '', 'dong': '', 'kok': '',
+    'deh': '', 'tuh': '', 'nih': '', 'yah': '', 'ya': 'yes',
+    
+    # Common colloquial
+    'gitu': 'like that', 'gini': 'like this', 'kayak': 'like', 'kaya': 'like',
+    'gimana': 'how', 'emang': 'indeed', 'memang': 'indeed',
+    'udah': 'already', 'belom': 'not yet', 'aja': 'just',
+    
+    # Common abbreviations
+    'yg': 'which', 'dgn': 'with', 'utk': 'for', 'dr': 'from', 'pd': 'on',
+    'dlm': 'in', 'krn': 'because', 'jk': 'if', 'jgn': 'do not',
+    'bgt': 'very', 'bngt': 'very', 'gk': 'not', 'ga': 'not', 'tdk': 'not',
+    'blm': 'not yet', 'sdh': 'already', 'lg': 'again',
+    'sm': 'with', 'sma': 'same', 'kl': 'if', 'klo': 'if', 'kalo': 'if',
+    
+    # Family terms
+    'ayah': 'father', 'ibu': 'mother', 'bapak': 'father', 'mama': 'mother',
+    'papa': 'father', 'kakak': 'sibling', 'adik': 'sibling', 'anak': 'child',
+    
+    # Time words
+    'sekarang': 'now', 'nanti': 'later', 'kemarin': 'yesterday', 'besok': 'tomorrow',
+    'hari': 'day', 'minggu': 'week', 'bulan': 'month', 'tahun': 'year',
+    'jam': 'hour', 'menit': 'minute', 'detik': 'second',
+    
+    # Common expressions
+    'terima kasih': 'thank you', 'maaf': 'sorry', 'permisi': 'excuse me',
+    'selamat': 'congratulations', 'halo': 'hello', 'hai': 'hi',
+    
+    # Laughing expressions
+    'haha': 'haha', 'hehe': 'hehe', 'hihi': 'hihi', 'hoho': 'hoho', 'huhu': 'huhu',
+    'hahaha': 'hahaha', 'hehehe': 'hehehe', 'hahahaha': 'hahahaha',
+    
+    # Common internet slang
+    'wkwk': 'lol', 'wkwkwk': 'lol', 'kwkw': 'lol', 'anjay': 'wow',
+    'mantap': 'great', 'keren': 'cool', 'bagus': 'good', 'jelek': 'bad',
+}
+
+# Words used for partial matches inside compound words, in dictionary order
+PARTIAL_MATCH_WORDS = MappingProxyType(
+    {indo_word: eng_word for indo_word, eng_word in INDONESIAN_ENGLISH_DICT.items() if len(indo_word) > 2}
+)
+
+# All partial-match words in a single automaton, so each lookup scans the text once
+if ahocorasick is not None:
+    PARTIAL_MATCH_AUTOMATON = ahocorasick.Automaton()
+    for rank, (indo_word, eng_word) in enumerate(PARTIAL_MATCH_WORDS.items()):
+        PARTIAL_MATCH_AUTOMATON.add_word(indo_word, (rank, eng_word))
+    PARTIAL_MATCH_AUTOMATON.make_automaton()
+else:
+    PARTIAL_MATCH_AUTOMATON = None
+
+def translate_using_dictionary(text):
+    """Translate using predefined dictionary"""
+    text_lower = text.lower().strip()
+    
+    # Direct match
+    translation = INDONESIAN_ENGLISH_DICT.get(text_lower)
+    if translation is not None:
+        return translation
+    
+    # Check for partial matches (for compound words); the earliest dictionary entry wins
+    if PARTIAL_MATCH_AUTOMATON is not None:
+        matches = [value for _, value in PARTIAL_MATCH_AUTOMATON.iter(text_lower)]
+        return min(matches)[1] if matches else None
+    
+    for indo_word, eng_word in PARTIAL_MATCH_WORDS.items():
+        if indo_word in text_lower:
+            return eng_word
+    
+    return None
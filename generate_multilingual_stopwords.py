@@ -13,15 +13,477 @@ Date: 2025-07-03
 import pandas as pd
 import nltk
 from collections import OrderedDict, Counter
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import re
 from datasets import load_dataset
 import string
+import pickle
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Minimum number of entries the generated dataset should contain
+TARGET_ENTRY_COUNT = 1500
+
+# Output column order
+COLUMNS = ['en', 'id', 'jv', 'su', 'formal_id']
+
+# Word tokenizer for NusaX texts, including accented characters
+TOKEN_PATTERN = re.compile(r'\b[a-zA-ZÀ-ÿ]+\b')
+
+
+# Comprehensive additional words and variations
+ADDITIONAL_WORDS = (
+    # More English words
+    ('about', 'tentang', '', '', 'tentang'),
+    ('above', 'atas', '', '', 'atas'),
+    ('across', 'seberang', '', '', 'seberang'),
+    ('against', 'melawan', '', '', 'melawan'),
+    ('along', 'sepanjang', '', '', 'sepanjang'),
+    ('among', 'antara', '', '', 'antara'),
+    ('around', 'sekitar', '', '', 'sekitar'),
+    ('behind', 'belakang', '', '', 'belakang'),
+    ('below', 'bawah', '', '', 'bawah'),
+    ('beneath', 'bawah', '', '', 'bawah'),
+    ('beside', 'samping', '', '', 'samping'),
+    ('between', 'antara', '', '', 'antara'),
+    ('beyond', 'melampaui', '', '', 'melampaui'),
+    ('during', 'selama', '', '', 'selama'),
+    ('except', 'kecuali', '', '', 'kecuali'),
+    ('inside', 'dalam', '', '', 'dalam'),
+    ('outside', 'luar', '', '', 'luar'),
+    ('through', 'melalui', '', '', 'melalui'),
+    ('throughout', 'sepanjang', '', '', 'sepanjang'),
+    ('toward', 'menuju', '', '', 'menuju'),
+    ('towards', 'menuju', '', '', 'menuju'),
+    ('under', 'bawah', '', '', 'bawah'),
+    ('until', 'sampai', '', '', 'sampai'),
+    ('upon', 'atas', '', '', 'atas'),
+    ('within', 'dalam', '', '', 'dalam'),
+    ('without', 'tanpa', '', '', 'tanpa'),
+
+    # More Indonesian variations and slang
+    ('', 'aja', '', '', 'saja'),
+    ('', 'doang', '', '', 'saja'),
+    ('', 'kok', '', '', ''),
+    ('', 'sih', '', '', ''),
+    ('', 'deh', '', '', ''),
+    ('', 'dong', '', '', ''),
+    ('', 'lah', '', '', ''),
+    ('', 'kah', '', '', ''),
+    ('', 'tuh', '', '', ''),
+    ('', 'nih', '', '', ''),
+    ('', 'yah', '', '', ''),
+    ('', 'wah', '', '', ''),
+    ('', 'aduh', '', '', ''),
+    ('', 'astaga', '', '', ''),
+    ('', 'alamak', '', '', ''),
+    ('', 'waduh', '', '', ''),
+    ('', 'duh', '', '', ''),
+    ('', 'ih', '', '', ''),
+    ('', 'eh', '', '', ''),
+    ('', 'ah', '', '', ''),
+    ('', 'oh', '', '', ''),
+    ('', 'uh', '', '', ''),
+    ('', 'hmm', '', '', ''),
+    ('', 'hm', '', '', ''),
+    ('', 'em', '', '', ''),
+    ('', 'um', '', '', ''),
+    ('', 'nah', '', '', ''),
+    ('', 'kan', '', '', ''),
+    ('', 'gitu', '', '', 'begitu'),
+    ('', 'gini', '', '', 'begini'),
+    ('', 'kayak', '', '', 'seperti'),
+    ('', 'kaya', '', '', 'seperti'),
+    ('', 'macam', '', '', 'seperti'),
+    ('', 'banget', '', '', 'sangat'),
+    ('', 'bgt', '', '', 'sangat'),
+    ('', 'bener', '', '', 'benar'),
+    ('', 'emang', '', '', 'memang'),
+    ('', 'memang', '', '', 'memang'),
+
+    # Numbers and time expressions
+    ('one', 'satu', 'siji', 'hiji', 'satu'),
+    ('two', 'dua', 'loro', 'dua', 'dua'),
+    ('three', 'tiga', 'telu', 'tilu', 'tiga'),
+    ('four', 'empat', 'papat', 'opat', 'empat'),
+    ('five', 'lima', 'lima', 'lima', 'lima'),
+    ('six', 'enam', 'enem', 'genep', 'enam'),
+    ('seven', 'tujuh', 'pitu', 'tujuh', 'tujuh'),
+    ('eight', 'delapan', 'wolu', 'dalapan', 'delapan'),
+    ('nine', 'sembilan', 'sanga', 'salapan', 'sembilan'),
+    ('ten', 'sepuluh', 'sepuluh', 'sapuluh', 'sepuluh'),
+    ('today', 'hari ini', 'dina iki', 'dinten ieu', 'hari ini'),
+    ('tomorrow', 'besok', 'sesuk', 'isukan', 'besok'),
+    ('yesterday', 'kemarin', 'wingi', 'kamari', 'kemarin'),
+    ('morning', 'pagi', 'esuk', 'isuk', 'pagi'),
+    ('afternoon', 'siang', 'awan', 'siang', 'siang'),
+    ('evening', 'sore', 'sore', 'sonten', 'sore'),
+    ('night', 'malam', 'bengi', 'wengi', 'malam'),
+
+    # More social media terms and internet slang
+    ('', 'wkwkwkwk', '', '', 'hahaha'),
+    ('', 'wkwkland', '', '', 'indonesia'),
+    ('', 'xixi', '', '', 'hehe'),
+    ('', 'xixixixi', '', '', 'hehehe'),
+    ('', 'kwkwkw', '', '', 'hahaha'),
+    ('', 'wakaka', '', '', 'hahaha'),
+    ('', 'wakakaka', '', '', 'hahaha'),
+    ('', 'hahaha', '', '', 'hahaha'),
+    ('', 'hehehe', '', '', 'hehehe'),
+    ('', 'hihi', '', '', 'hihi'),
+    ('', 'hoho', '', '', 'hoho'),
+    ('', 'huhu', '', '', 'huhu'),
+    ('', 'wkwk', '', '', 'haha'),
+    ('', 'kwkw', '', '', 'haha'),
+    ('', 'kkkk', '', '', 'haha'),
+    ('', 'kkkkk', '', '', 'hahaha'),
+    ('', 'wkakaka', '', '', 'hahaha'),
+    ('', 'wakwaw', '', '', 'haha'),
+    ('', 'wkwkwk', '', '', 'hahaha'),
+
+    # More Indonesian formal and colloquial
+    ('', 'sekarang', '', '', 'sekarang'),
+    ('', 'skrg', '', '', 'sekarang'),
+    ('', 'skrang', '', '', 'sekarang'),
+    ('', 'nanti', '', '', 'nanti'),
+    ('', 'ntar', '', '', 'nanti'),
+    ('', 'tar', '', '', 'nanti'),
+    ('', 'tadi', '', '', 'tadi'),
+    ('', 'td', '', '', 'tadi'),
+    ('', 'kemarin', '', '', 'kemarin'),
+    ('', 'kmrn', '', '', 'kemarin'),
+    ('', 'besok', '', '', 'besok'),
+    ('', 'bsk', '', '', 'besok'),
+    ('', 'lusa', '', '', 'lusa'),
+    ('', 'minggu', '', '', 'minggu'),
+    ('', 'mgg', '', '', 'minggu'),
+    ('', 'bulan', '', '', 'bulan'),
+    ('', 'bln', '', '', 'bulan'),
+    ('', 'tahun', '', '', 'tahun'),
+    ('', 'thn', '', '', 'tahun'),
+    ('', 'hari', '', '', 'hari'),
+    ('', 'hr', '', '', 'hari'),
+    ('', 'jam', '', '', 'jam'),
+    ('', 'menit', '', '', 'menit'),
+    ('', 'mnt', '', '', 'menit'),
+    ('', 'detik', '', '', 'detik'),
+    ('', 'dtk', '', '', 'detik'),
+
+    # More Javanese terms
+    ('', '', 'aku', '', 'saya'),
+    ('', '', 'kowe', '', 'kamu'),
+    ('', '', 'dheweke', '', 'dia'),
+    ('', '', 'awakmu', '', 'kamu'),
+    ('', '', 'awakne', '', 'dia'),
+    ('', '', 'iki', '', 'ini'),
+    ('', '', 'iku', '', 'itu'),
+    ('', '', 'kene', '', 'sini'),
+    ('', '', 'kono', '', 'sana'),
+    ('', '', 'ngendi', '', 'dimana'),
+    ('', '', 'piye', '', 'bagaimana'),
+    ('', '', 'apa', '', 'apa'),
+    ('', '', 'sapa', '', 'siapa'),
+    ('', '', 'kapan', '', 'kapan'),
+    ('', '', 'ngapa', '', 'kenapa'),
+    ('', '', 'ning', '', 'di'),
+    ('', '', 'nang', '', 'di'),
+    ('', '', 'menyang', '', 'ke'),
+    ('', '', 'saka', '', 'dari'),
+    ('', '', 'kanggo', '', 'untuk'),
+    ('', '', 'karo', '', 'dengan'),
+    ('', '', 'lan', '', 'dan'),
+    ('', '', 'utawa', '', 'atau'),
+    ('', '', 'nanging', '', 'tetapi'),
+    ('', '', 'merga', '', 'karena'),
+    ('', '', 'yen', '', 'jika'),
+    ('', '', 'nalika', '', 'ketika'),
+    ('', '', 'arep', '', 'akan'),
+    ('', '', 'wis', '', 'sudah'),
+    ('', '', 'lagi', '', 'sedang'),
+    ('', '', 'isih', '', 'masih'),
+    ('', '', 'durung', '', 'belum'),
+    ('', '', 'ora', '', 'tidak'),
+    ('', '', 'dudu', '', 'bukan'),
+    ('', '', 'ana', '', 'ada'),
+    ('', '', 'ora ana', '', 'tidak ada'),
+    ('', '', 'kabeh', '', 'semua'),
+    ('', '', 'akeh', '', 'banyak'),
+    ('', '', 'sithik', '', 'sedikit'),
+    ('', '', 'banget', '', 'sangat'),
+    ('', '', 'apik', '', 'bagus'),
+    ('', '', 'elek', '', 'jelek'),
+    ('', '', 'gedhe', '', 'besar'),
+    ('', '', 'cilik', '', 'kecil'),
+    ('', '', 'dawa', '', 'panjang'),
+    ('', '', 'cendhak', '', 'pendek'),
+
+    # More Sundanese terms
+    ('', '', '', 'abdi', 'saya'),
+    ('', '', '', 'anjeun', 'kamu'),
+    ('', '', '', 'anjeunna', 'dia'),
+    ('', '', '', 'ieu', 'ini'),
+    ('', '', '', 'eta', 'itu'),
+    ('', '', '', 'dieu', 'sini'),
+    ('', '', '', 'dinya', 'sana'),
+    ('', '', '', 'dimana', 'dimana'),
+    ('', '', '', 'kumaha', 'bagaimana'),
+    ('', '', '', 'naon', 'apa'),
+    ('', '', '', 'saha', 'siapa'),
+    ('', '', '', 'iraha', 'kapan'),
+    ('', '', '', 'naha', 'kenapa'),
+    ('', '', '', 'di', 'di'),
+    ('', '', '', 'ka', 'ke'),
+    ('', '', '', 'ti', 'dari'),
+    ('', '', '', 'pikeun', 'untuk'),
+    ('', '', '', 'sareng', 'dengan'),
+    ('', '', '', 'jeung', 'dan'),
+    ('', '', '', 'atawa', 'atau'),
+    ('', '', '', 'tapi', 'tetapi'),
+    ('', '', '', 'sabab', 'karena'),
+    ('', '', '', 'lamun', 'jika'),
+    ('', '', '', 'nalika', 'ketika'),
+    ('', '', '', 'bade', 'akan'),
+    ('', '', '', 'parantos', 'sudah'),
+    ('', '', '', 'nuju', 'sedang'),
+    ('', '', '', 'masih', 'masih'),
+    ('', '', '', 'can', 'belum'),
+    ('', '', '', 'henteu', 'tidak'),
+    ('', '', '', 'sanés', 'bukan'),
+    ('', '', '', 'aya', 'ada'),
+    ('', '', '', 'teu aya', 'tidak ada'),
+    ('', '', '', 'sadaya', 'semua'),
+    ('', '', '', 'seueur', 'banyak'),
+    ('', '', '', 'saeutik', 'sedikit'),
+    ('', '', '', 'pisan', 'sangat'),
+    ('', '', '', 'saé', 'bagus'),
+    ('', '', '', 'awon', 'jelek'),
+    ('', '', '', 'ageung', 'besar'),
+    ('', '', '', 'alit', 'kecil'),
+    ('', '', '', 'panjang', 'panjang'),
+    ('', '', '', 'pondok', 'pendek'),
+
+    # Additional common words
+    ('good', 'bagus', 'apik', 'saé', 'bagus'),
+    ('bad', 'buruk', 'elek', 'awon', 'buruk'),
+    ('big', 'besar', 'gedhe', 'ageung', 'besar'),
+    ('small', 'kecil', 'cilik', 'alit', 'kecil'),
+    ('long', 'panjang', 'dawa', 'panjang', 'panjang'),
+    ('short', 'pendek', 'cendhak', 'pondok', 'pendek'),
+    ('new', 'baru', 'anyar', 'anyar', 'baru'),
+    ('old', 'lama', 'lawas', 'lami', 'lama'),
+    ('young', 'muda', 'enom', 'ngora', 'muda'),
+    ('fast', 'cepat', 'cepet', 'gancang', 'cepat'),
+    ('slow', 'lambat', 'alon', 'laun', 'lambat'),
+    ('hot', 'panas', 'panas', 'panas', 'panas'),
+    ('cold', 'dingin', 'adhem', 'tiis', 'dingin'),
+    ('warm', 'hangat', 'anget', 'haneut', 'hangat'),
+    ('cool', 'sejuk', 'adem', 'tiis', 'sejuk'),
+    ('wet', 'basah', 'teles', 'baseuh', 'basah'),
+    ('dry', 'kering', 'garing', 'garing', 'kering'),
+    ('clean', 'bersih', 'resik', 'beresih', 'bersih'),
+    ('dirty', 'kotor', 'reged', 'kotor', 'kotor'),
+    ('easy', 'mudah', 'gampang', 'gampil', 'mudah'),
+    ('hard', 'sulit', 'angel', 'hese', 'sulit'),
+    ('light', 'ringan', 'entheng', 'hampang', 'ringan'),
+    ('heavy', 'berat', 'abot', 'beurat', 'berat'),
+    ('high', 'tinggi', 'dhuwur', 'luhur', 'tinggi'),
+    ('low', 'rendah', 'cendhek', 'handap', 'rendah'),
+    ('near', 'dekat', 'cedhak', 'deukeut', 'dekat'),
+    ('far', 'jauh', 'adoh', 'jauh', 'jauh'),
+    ('left', 'kiri', 'kiwa', 'kénca', 'kiri'),
+    ('right', 'kanan', 'tengen', 'katuhu', 'kanan'),
+    ('front', 'depan', 'ngarep', 'hareupeun', 'depan'),
+    ('back', 'belakang', 'mburi', 'tukang', 'belakang'),
+    ('up', 'atas', 'dhuwur', 'luhur', 'atas'),
+    ('down', 'bawah', 'ngisor', 'handap', 'bawah'),
+    ('first', 'pertama', 'pisanan', 'kahiji', 'pertama'),
+    ('last', 'terakhir', 'pungkasan', 'panungtungan', 'terakhir'),
+    ('next', 'berikutnya', 'sabanjure', 'salajengna', 'berikutnya'),
+    ('previous', 'sebelumnya', 'sadurunge', 'sateuacanna', 'sebelumnya'),
+    ('same', 'sama', 'padha', 'sarua', 'sama'),
+    ('different', 'berbeda', 'beda', 'béda', 'berbeda'),
+    ('true', 'benar', 'bener', 'leres', 'benar'),
+    ('false', 'salah', 'salah', 'lepat', 'salah'),
+    ('yes', 'ya', 'iya', 'enya', 'ya'),
+    ('no', 'tidak', 'ora', 'henteu', 'tidak'),
+    ('maybe', 'mungkin', 'mbok menawa', 'meureun', 'mungkin'),
+    ('sure', 'pasti', 'mesthi', 'pasti', 'pasti'),
+    ('never', 'tidak pernah', 'ora tau', 'henteu kantos', 'tidak pernah'),
+    ('always', 'selalu', 'tansah', 'salawasna', 'selalu'),
+    ('sometimes', 'kadang', 'kadhang', 'sakapeung', 'kadang'),
+    ('often', 'sering', 'kerep', 'mindeng', 'sering'),
+    ('rarely', 'jarang', 'arang', 'jarang', 'jarang'),
+    ('usually', 'biasanya', 'biasane', 'biasana', 'biasanya'),
+    ('normally', 'normalnya', 'lumrahe', 'biasana', 'normalnya'),
+    ('really', 'benar-benar', 'tenan', 'leres-leres', 'benar-benar'),
+    ('actually', 'sebenarnya', 'sejatine', 'saleresna', 'sebenarnya'),
+    ('probably', 'mungkin', 'mbok menawa', 'sigana', 'mungkin'),
+    ('definitely', 'pasti', 'mesthi', 'pasti', 'pasti'),
+    ('certainly', 'tentu', 'mesthi', 'tangtu', 'tentu'),
+    ('absolutely', 'mutlak', 'mutlak', 'mutlak', 'mutlak'),
+    ('completely', 'sepenuhnya', 'sakabehe', 'lengkep', 'sepenuhnya'),
+    ('totally', 'total', 'total', 'total', 'total'),
+    ('exactly', 'persis', 'persis', 'persis', 'persis'),
+    ('almost', 'hampir', 'meh', 'ampir', 'hampir'),
+    ('quite', 'cukup', 'cukup', 'cukup', 'cukup'),
+    ('rather', 'agak', 'rada', 'rada', 'agak'),
+    ('pretty', 'cukup', 'lumayan', 'lumayan', 'cukup'),
+    ('fairly', 'cukup', 'lumayan', 'lumayan', 'cukup'),
+    ('extremely', 'sangat', 'banget', 'pisan', 'sangat'),
+    ('incredibly', 'luar biasa', 'luar biasa', 'luar biasa', 'luar biasa'),
+    ('amazingly', 'menakjubkan', 'nggumunake', 'endah', 'menakjubkan'),
+    ('surprisingly', 'mengejutkan', 'nggumunake', 'héran', 'mengejutkan'),
+)
+
+# More Indonesian internet slang and abbreviations
+INTERNET_SLANG = (
+    ('', 'ygy', '', '', 'ya guys ya'),
+    ('', 'yg', '', '', 'yang'),
+    ('', 'sy', '', '', 'saya'),
+    ('', 'km', '', '', 'kamu'),
+    ('', 'dy', '', '', 'dia'),
+    ('', 'mrk', '', '', 'mereka'),
+    ('', 'kt', '', '', 'kita'),
+    ('', 'kmi', '', '', 'kami'),
+    ('', 'ini', '', '', 'ini'),
+    ('', 'itu', '', '', 'itu'),
+    ('', 'dan', '', '', 'dan'),
+    ('', 'atau', '', '', 'atau'),
+    ('', 'tp', '', '', 'tetapi'),
+    ('', 'krn', '', '', 'karena'),
+    ('', 'jk', '', '', 'jika'),
+    ('', 'ktk', '', '', 'ketika'),
+    ('', 'saat', '', '', 'saat'),
+    ('', 'wkt', '', '', 'waktu'),
+    ('', 'di', '', '', 'di'),
+    ('', 'ke', '', '', 'ke'),
+    ('', 'dr', '', '', 'dari'),
+    ('', 'utk', '', '', 'untuk'),
+    ('', 'dgn', '', '', 'dengan'),
+    ('', 'pd', '', '', 'pada'),
+    ('', 'dlm', '', '', 'dalam'),
+    ('', 'olh', '', '', 'oleh'),
+    ('', 'adlh', '', '', 'adalah'),
+    ('', 'akn', '', '', 'akan'),
+    ('', 'tlh', '', '', 'telah'),
+    ('', 'sdh', '', '', 'sudah'),
+    ('', 'sdg', '', '', 'sedang'),
+    ('', 'msh', '', '', 'masih'),
+    ('', 'blm', '', '', 'belum'),
+    ('', 'tdk', '', '', 'tidak'),
+    ('', 'bkn', '', '', 'bukan'),
+    ('', 'jgn', '', '', 'jangan'),
+    ('', 'ada', '', '', 'ada'),
+    ('', 'smu', '', '', 'semua'),
+    ('', 'stp', '', '', 'setiap'),
+    ('', 'bbp', '', '', 'beberapa'),
+    ('', 'bnyk', '', '', 'banyak'),
+    ('', 'sdkt', '', '', 'sedikit'),
+    ('', 'sgt', '', '', 'sangat'),
+    ('', 'agk', '', '', 'agak'),
+    ('', 'ckp', '', '', 'cukup'),
+    ('', 'tll', '', '', 'terlalu'),
+    ('', 'plg', '', '', 'paling'),
+    ('', 'lbh', '', '', 'lebih'),
+    ('', 'krg', '', '', 'kurang'),
+)
+
+# More emotional expressions and reactions
+EMOTIONS = (
+    ('', 'huft', '', '', ''),
+    ('', 'hufh', '', '', ''),
+    ('', 'hufft', '', '', ''),
+    ('', 'haah', '', '', ''),
+    ('', 'haaah', '', '', ''),
+    ('', 'aaah', '', '', ''),
+    ('', 'oooh', '', '', ''),
+    ('', 'uuuh', '', '', ''),
+    ('', 'eeeh', '', '', ''),
+    ('', 'iiih', '', '', ''),
+    ('', 'owh', '', '', ''),
+    ('', 'owwh', '', '', ''),
+    ('', 'owwwh', '', '', ''),
+    ('', 'hehe', '', '', ''),
+    ('', 'hihi', '', '', ''),
+    ('', 'hoho', '', '', ''),
+    ('', 'huhu', '', '', ''),
+    ('', 'haha', '', '', ''),
+    ('', 'hehe', '', '', ''),
+    ('', 'xixi', '', '', ''),
+    ('', 'keke', '', '', ''),
+    ('', 'gege', '', '', ''),
+    ('', 'wkwk', '', '', ''),
+    ('', 'kwkw', '', '', ''),
+    ('', 'wakaka', '', '', ''),
+    ('', 'wkakaka', '', '', ''),
+    ('', 'wakakaka', '', '', ''),
+    ('', 'wkwkwk', '', '', ''),
+    ('', 'wkwkwkwk', '', '', ''),
+    ('', 'kwkwkw', '', '', ''),
+    ('', 'kwkwkwkw', '', '', ''),
+)
+
+# More question words and variations
+QUESTIONS = (
+    ('', 'gimana', '', '', 'bagaimana'),
+    ('', 'gmn', '', '', 'bagaimana'),
+    ('', 'bgmn', '', '', 'bagaimana'),
+    ('', 'kenapa', '', '', 'kenapa'),
+    ('', 'knp', '', '', 'kenapa'),
+    ('', 'knapa', '', '', 'kenapa'),
+    ('', 'mengapa', '', '', 'mengapa'),
+    ('', 'dimana', '', '', 'dimana'),
+    ('', 'dmn', '', '', 'dimana'),
+    ('', 'dmana', '', '', 'dimana'),
+    ('', 'kemana', '', '', 'kemana'),
+    ('', 'kmn', '', '', 'kemana'),
+    ('', 'kmana', '', '', 'kemana'),
+    ('', 'darimana', '', '', 'darimana'),
+    ('', 'drmn', '', '', 'darimana'),
+    ('', 'drmana', '', '', 'darimana'),
+    ('', 'siapa', '', '', 'siapa'),
+    ('', 'spa', '', '', 'siapa'),
+    ('', 'sapa', '', '', 'siapa'),
+    ('', 'apa', '', '', 'apa'),
+    ('', 'apaan', '', '', 'apa'),
+    ('', 'apain', '', '', 'apa'),
+    ('', 'mana', '', '', 'mana'),
+    ('', 'mn', '', '', 'mana'),
+    ('', 'kapan', '', '', 'kapan'),
+    ('', 'kpn', '', '', 'kapan'),
+    ('', 'kpan', '', '', 'kapan'),
+)
+
+# More time-related expressions
+TIME_EXPRESSIONS = (
+    ('', 'sekarang', '', '', 'sekarang'),
+    ('', 'skrg', '', '', 'sekarang'),
+    ('', 'skrang', '', '', 'sekarang'),
+    ('', 'nanti', '', '', 'nanti'),
+    ('', 'ntar', '', '', 'nanti'),
+    ('', 'tar', '', '', 'nanti'),
+    ('', 'tadi', '', '', 'tadi'),
+    ('', 'td', '', '', 'tadi'),
+    ('', 'barusan', '', '', 'baru saja'),
+    ('', 'brsan', '', '', 'baru saja'),
+    ('', 'baru', '', '', 'baru'),
+    ('', 'br', '', '', 'baru'),
+    ('', 'lama', '', '', 'lama'),
+    ('', 'lm', '', '', 'lama'),
+    ('', 'cepat', '', '', 'cepat'),
+    ('', 'cpat', '', '', 'cepat'),
+    ('', 'cpt', '', '', 'cepat'),
+    ('', 'lambat', '', '', 'lambat'),
+    ('', 'lmbt', '', '', 'lambat'),
+    ('', 'pelan', '', '', 'pelan'),
+    ('', 'pln', '', '', 'pelan'),
+)
+
+
 class MultilingualStopwordGenerator:
     """
     A class to generate multilingual stopwords for social media domain
@@ -29,7 +491,8 @@ class MultilingualStopwordGenerator:
     
     def __init__(self):
         """Initialize the generator with language mappings and dictionaries"""
-        self.stopwords_data = []
+        # Columnar storage: one list per output column
+        self.stopwords_data = {col: [] for col in COLUMNS}
         self.setup_nltk()
         self.setup_language_mappings()
         self.nusax_data = None
@@ -196,6 +659,120 @@ class MultilingualStopwordGenerator:
             'pendek': 'pondok'
         }
 
+        # Basic English to Indonesian mappings
+        self.en_to_id_mapping = {
+            'i': 'saya',
+            'me': 'saya',
+            'my': 'saya',
+            'we': 'kita',
+            'our': 'kita',
+            'you': 'kamu',
+            'your': 'kamu',
+            'he': 'dia',
+            'him': 'dia',
+            'his': 'dia',
+            'she': 'dia',
+            'her': 'dia',
+            'it': 'itu',
+            'they': 'mereka',
+            'them': 'mereka',
+            'their': 'mereka',
+            'this': 'ini',
+            'that': 'itu',
+            'these': 'ini',
+            'those': 'itu',
+            'and': 'dan',
+            'or': 'atau',
+            'but': 'tetapi',
+            'if': 'jika',
+            'because': 'karena',
+            'when': 'ketika',
+            'while': 'sementara',
+            'before': 'sebelum',
+            'after': 'setelah',
+            'in': 'di',
+            'on': 'di',
+            'at': 'di',
+            'by': 'oleh',
+            'for': 'untuk',
+            'with': 'dengan',
+            'from': 'dari',
+            'to': 'ke',
+            'of': 'dari',
+            'the': '',  # No direct equivalent
+            'a': '',    # No direct equivalent
+            'an': '',   # No direct equivalent
+            'is': 'adalah',
+            'are': 'adalah',
+            'was': 'adalah',
+            'were': 'adalah',
+            'be': 'adalah',
+            'been': 'telah',
+            'being': 'sedang',
+            'have': 'punya',
+            'has': 'punya',
+            'had': 'punya',
+            'do': '',
+            'does': '',
+            'did': '',
+            'will': 'akan',
+            'would': 'akan',
+            'could': 'bisa',
+            'should': 'harus',
+            'may': 'mungkin',
+            'might': 'mungkin',
+            'can': 'bisa',
+            'must': 'harus',
+            'not': 'tidak',
+            'no': 'tidak',
+            'yes': 'ya',
+            'all': 'semua',
+            'any': 'apapun',
+            'some': 'beberapa',
+            'many': 'banyak',
+            'much': 'banyak',
+            'few': 'sedikit',
+            'little': 'sedikit',
+            'more': 'lebih',
+            'most': 'paling',
+            'less': 'kurang',
+            'very': 'sangat',
+            'too': 'terlalu',
+            'so': 'jadi',
+            'just': 'hanya',
+            'only': 'hanya',
+            'also': 'juga',
+            'even': 'bahkan',
+            'still': 'masih',
+            'yet': 'belum',
+            'already': 'sudah',
+            'now': 'sekarang',
+            'then': 'kemudian',
+            'here': 'disini',
+            'there': 'disana',
+            'where': 'dimana',
+            'how': 'bagaimana',
+            'what': 'apa',
+            'who': 'siapa',
+            'why': 'mengapa',
+            'which': 'yang mana'
+        }
+
+        # Javanese and Sundanese equivalents keyed by formal Indonesian word
+        self.formal_to_jvsu = {
+            formal: (self.javanese_mappings.get(formal, ''), self.sundanese_mappings.get(formal, ''))
+            for formal in self.javanese_mappings.keys() | self.sundanese_mappings.keys()
+        }
+
+        # Reverse lookups from Javanese/Sundanese word to formal Indonesian;
+        # the first mapping listed wins when several share the same word
+        self.jv_to_formal = {}
+        for formal, jv_word in self.javanese_mappings.items():
+            self.jv_to_formal.setdefault(jv_word, formal)
+        self.su_to_formal = {}
+        for formal, su_word in self.sundanese_mappings.items():
+            self.su_to_formal.setdefault(su_word, formal)
+
         # Social media specific particles and interjections
         self.social_media_particles = {
             'deh', 'dong', 'sih', 'kok', 'lah', 'kah', 'tuh', 'nih',
@@ -210,182 +787,51 @@ class MultilingualStopwordGenerator:
 
     def add_stopword_entry(self, en='', id_word='', jv='', su='', formal_id=''):
         """Add a stopword entry to the dataset"""
-        entry = {
-            'en': en.strip(),
-            'id': id_word.strip(),
-            'jv': jv.strip(),
-            'su': su.strip(),
-            'formal_id': formal_id.strip()
-        }
-        self.stopwords_data.append(entry)
-
-    def generate_from_english_stopwords(self):
-        """Generate entries starting from English stopwords"""
-        logger.info("Generating entries from English stopwords...")
-
-        for en_word in self.english_stopwords:
-            # Try to find Indonesian equivalent
-            id_word = ''
-            formal_id = ''
-            jv_word = ''
-            su_word = ''
-
-            # Basic English to Indonesian mappings
-            en_to_id_mapping = {
-                'i': 'saya',
-                'me': 'saya',
-                'my': 'saya',
-                'we': 'kita',
-                'our': 'kita',
-                'you': 'kamu',
-                'your': 'kamu',
-                'he': 'dia',
-                'him': 'dia',
-                'his': 'dia',
-                'she': 'dia',
-                'her': 'dia',
-                'it': 'itu',
-                'they': 'mereka',
-                'them': 'mereka',
-                'their': 'mereka',
-                'this': 'ini',
-                'that': 'itu',
-                'these': 'ini',
-                'those': 'itu',
-                'and': 'dan',
-                'or': 'atau',
-                'but': 'tetapi',
-                'if': 'jika',
-                'because': 'karena',
-                'when': 'ketika',
-                'while': 'sementara',
-                'before': 'sebelum',
-                'after': 'setelah',
-                'in': 'di',
-                'on': 'di',
-                'at': 'di',
-                'by': 'oleh',
-                'for': 'untuk',
-                'with': 'dengan',
-                'from': 'dari',
-                'to': 'ke',
-                'of': 'dari',
-                'the': '',  # No direct equivalent
-                'a': '',    # No direct equivalent
-                'an': '',   # No direct equivalent
-                'is': 'adalah',
-                'are': 'adalah',
-                'was': 'adalah',
-                'were': 'adalah',
-                'be': 'adalah',
-                'been': 'telah',
-                'being': 'sedang',
-                'have': 'punya',
-                'has': 'punya',
-                'had': 'punya',
-                'do': '',
-                'does': '',
-                'did': '',
-                'will': 'akan',
-                'would': 'akan',
-                'could': 'bisa',
-                'should': 'harus',
-                'may': 'mungkin',
-                'might': 'mungkin',
-                'can': 'bisa',
-                'must': 'harus',
-                'not': 'tidak',
-                'no': 'tidak',
-                'yes': 'ya',
-                'all': 'semua',
-                'any': 'apapun',
-                'some': 'beberapa',
-                'many': 'banyak',
-                'much': 'banyak',
-                'few': 'sedikit',
-                'little': 'sedikit',
-                'more': 'lebih',
-                'most': 'paling',
-                'less': 'kurang',
-                'very': 'sangat',
-                'too': 'terlalu',
-                'so': 'jadi',
-                'just': 'hanya',
-                'only': 'hanya',
-                'also': 'juga',
-                'even': 'bahkan',
-                'still': 'masih',
-                'yet': 'belum',
-                'already': 'sudah',
-                'now': 'sekarang',
-                'then': 'kemudian',
-                'here': 'disini',
-                'there': 'disana',
-                'where': 'dimana',
-                'how': 'bagaimana',
-                'what': 'apa',
-                'who': 'siapa',
-                'why': 'mengapa',
-                'which': 'yang mana'
-            }
-
-            if en_word in en_to_id_mapping:
-                formal_id = en_to_id_mapping[en_word]
-                id_word = formal_id  # Default to formal
-
-                # Check if there's a Javanese equivalent
-                if formal_id in self.javanese_mappings:
-                    jv_word = self.javanese_mappings[formal_id]
-
-                # Check if there's a Sundanese equivalent
-                if formal_id in self.sundanese_mappings:
-                    su_word = self.sundanese_mappings[formal_id]
-
+        data = self.stopwords_data
+        data['en'].append(en.strip())
+        data['id'].append(id_word.strip())
+        data['jv'].append(jv.strip())
+        data['su'].append(su.strip())
+        data['formal_id'].append(formal_id.strip())
+
+    def add_stopword_entries(self, entries):
+        """Bulk-add (en, id, jv, su, formal_id) tuples column by column"""
+        if not entries:
+            return
+        for col, values in zip(COLUMNS, zip(*entries)):
+            self.stopwords_data[col].extend(values)
+
+    def generate_from_sources(self):
+        """Generate entries from English stopwords, Indonesian slang and formal words in one pass"""
+        logger.info("Generating entries from English stopwords, Indonesian slang and formal words...")
+
+        # (en, id, formal_id) triples from every source; Javanese and Sundanese
+        # equivalents are then looked up once from the formal Indonesian word
+        sources = chain(
+            ((w, self.en_to_id_mapping.get(w, ''), self.en_to_id_mapping.get(w, ''))
+             for w in self.english_stopwords),
+            (('', slang, formal) for slang, formal in self.indonesian_slang.items()),
+            (('', formal, formal) for formal in self.indonesian_formal),
+        )
+
+        for en_word, id_word, formal_id in sources:
+            jv_word, su_word = self.formal_to_jvsu.get(formal_id, ('', ''))
             self.add_stopword_entry(en_word, id_word, jv_word, su_word, formal_id)
 
-    def generate_from_indonesian_slang(self):
-        """Generate entries from Indonesian slang and social media terms"""
-        logger.info("Generating entries from Indonesian slang...")
-
-        for slang, formal in self.indonesian_slang.items():
-            jv_word = ''
-            su_word = ''
-
-            # Try to find Javanese equivalent for the formal word
-            if formal in self.javanese_mappings:
-                jv_word = self.javanese_mappings[formal]
-
-            # Try to find Sundanese equivalent for the formal word
-            if formal in self.sundanese_mappings:
-                su_word = self.sundanese_mappings[formal]
-
-            self.add_stopword_entry('', slang, jv_word, su_word, formal)
-
-    def generate_from_formal_indonesian(self):
-        """Generate entries from formal Indonesian words"""
-        logger.info("Generating entries from formal Indonesian words...")
-
-        for formal_word in self.indonesian_formal:
-            jv_word = ''
-            su_word = ''
-
-            # Try to find Javanese equivalent
-            if formal_word in self.javanese_mappings:
-                jv_word = self.javanese_mappings[formal_word]
-
-            # Try to find Sundanese equivalent
-            if formal_word in self.sundanese_mappings:
-                su_word = self.sundanese_mappings[formal_word]
-
-            self.add_stopword_entry('', formal_word, jv_word, su_word, formal_word)
-
     def generate_from_social_media_particles(self):
         """Generate entries from social media particles and interjections"""
         logger.info("Generating entries from social media particles...")
 
-        for particle in self.social_media_particles:
-            # Most particles don't have direct equivalents in other languages
-            self.add_stopword_entry('', particle, '', '', particle)
+        # Most particles don't have direct equivalents in other languages,
+        # so the entries are built in bulk without going through add_stopword_entry
+        particles = list(self.social_media_particles)
+        empty = [''] * len(particles)
+        data = self.stopwords_data
+        data['en'].extend(empty)
+        data['id'].extend(particles)
+        data['jv'].extend(empty)
+        data['su'].extend(empty)
+        data['formal_id'].extend(particles)
 
     def add_additional_entries(self):
         """Add additional common social media terms and expressions"""
@@ -483,26 +929,26 @@ class MultilingualStopwordGenerator:
             ('', '', '', 'naha', 'kenapa'),
         ]
 
-        for entry in additional_terms:
-            self.add_stopword_entry(*entry)
+        self.add_stopword_entries(additional_terms)
 
     def deduplicate_entries(self):
         """Remove duplicate entries from the dataset"""
         logger.info("Deduplicating entries...")
 
         seen = set()
-        unique_data = []
-
-        for entry in self.stopwords_data:
-            # Create a tuple of all non-empty values for comparison
-            key_values = tuple(v for v in entry.values() if v.strip())
+        unique_rows = []
 
-            if key_values and key_values not in seen:
-                seen.add(key_values)
-                unique_data.append(entry)
+        for row in zip(*(self.stopwords_data[col] for col in COLUMNS)):
+            # Compare whole rows by column position, so the same word in
+            # different language columns stays a distinct entry
+            if any(row) and row not in seen:
+                seen.add(row)
+                unique_rows.append(row)
 
-        self.stopwords_data = unique_data
-        logger.info(f"Removed duplicates. Final count: {len(self.stopwords_data)} entries")
+        self.stopwords_data = {col: [] for col in COLUMNS}
+        self.add_stopword_entries(unique_rows)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Removed duplicates. Final count: {len(self.stopwords_data['en'])} entries")
 
     def generate_dataset(self):
         """Generate the complete multilingual stopword dataset"""
@@ -513,338 +959,27 @@ class MultilingualStopwordGenerator:
             self.extract_stopwords_from_nusax()
 
         # Generate from different sources
-        self.generate_from_english_stopwords()
-        self.generate_from_indonesian_slang()
-        self.generate_from_formal_indonesian()
+        self.generate_from_sources()
         self.generate_from_social_media_particles()
         self.add_additional_entries()
+        self.add_more_entries_to_reach_target()
 
-        # Remove duplicates
+        # Remove duplicates once, after every source has been added
         self.deduplicate_entries()
 
-        # Ensure we have at least 1500 entries
-        if len(self.stopwords_data) < 1500:
-            logger.warning(f"Only {len(self.stopwords_data)} entries generated. Adding more...")
-            self.add_more_entries_to_reach_target()
+        if len(self.stopwords_data['en']) < TARGET_ENTRY_COUNT:
+            logger.warning(f"Only {len(self.stopwords_data['en'])} entries generated, "
+                           f"below the {TARGET_ENTRY_COUNT} target")
 
-        logger.info(f"Dataset generation complete. Total entries: {len(self.stopwords_data)}")
+        logger.info(f"Dataset generation complete. Total entries: {len(self.stopwords_data['en'])}")
         return self.stopwords_data
 
     def add_more_entries_to_reach_target(self):
-        """Add more entries to reach the 1500 target"""
-        # Comprehensive additional words and variations
-        additional_words = [
-            # More English words
-            ('about', 'tentang', '', '', 'tentang'),
-            ('above', 'atas', '', '', 'atas'),
-            ('across', 'seberang', '', '', 'seberang'),
-            ('against', 'melawan', '', '', 'melawan'),
-            ('along', 'sepanjang', '', '', 'sepanjang'),
-            ('among', 'antara', '', '', 'antara'),
-            ('around', 'sekitar', '', '', 'sekitar'),
-            ('behind', 'belakang', '', '', 'belakang'),
-            ('below', 'bawah', '', '', 'bawah'),
-            ('beneath', 'bawah', '', '', 'bawah'),
-            ('beside', 'samping', '', '', 'samping'),
-            ('between', 'antara', '', '', 'antara'),
-            ('beyond', 'melampaui', '', '', 'melampaui'),
-            ('during', 'selama', '', '', 'selama'),
-            ('except', 'kecuali', '', '', 'kecuali'),
-            ('inside', 'dalam', '', '', 'dalam'),
-            ('outside', 'luar', '', '', 'luar'),
-            ('through', 'melalui', '', '', 'melalui'),
-            ('throughout', 'sepanjang', '', '', 'sepanjang'),
-            ('toward', 'menuju', '', '', 'menuju'),
-            ('towards', 'menuju', '', '', 'menuju'),
-            ('under', 'bawah', '', '', 'bawah'),
-            ('until', 'sampai', '', '', 'sampai'),
-            ('upon', 'atas', '', '', 'atas'),
-            ('within', 'dalam', '', '', 'dalam'),
-            ('without', 'tanpa', '', '', 'tanpa'),
-
-            # More Indonesian variations and slang
-            ('', 'aja', '', '', 'saja'),
-            ('', 'doang', '', '', 'saja'),
-            ('', 'kok', '', '', ''),
-            ('', 'sih', '', '', ''),
-            ('', 'deh', '', '', ''),
-            ('', 'dong', '', '', ''),
-            ('', 'lah', '', '', ''),
-            ('', 'kah', '', '', ''),
-            ('', 'tuh', '', '', ''),
-            ('', 'nih', '', '', ''),
-            ('', 'yah', '', '', ''),
-            ('', 'wah', '', '', ''),
-            ('', 'aduh', '', '', ''),
-            ('', 'astaga', '', '', ''),
-            ('', 'alamak', '', '', ''),
-            ('', 'waduh', '', '', ''),
-            ('', 'duh', '', '', ''),
-            ('', 'ih', '', '', ''),
-            ('', 'eh', '', '', ''),
-            ('', 'ah', '', '', ''),
-            ('', 'oh', '', '', ''),
-            ('', 'uh', '', '', ''),
-            ('', 'hmm', '', '', ''),
-            ('', 'hm', '', '', ''),
-            ('', 'em', '', '', ''),
-            ('', 'um', '', '', ''),
-            ('', 'nah', '', '', ''),
-            ('', 'kan', '', '', ''),
-            ('', 'gitu', '', '', 'begitu'),
-            ('', 'gini', '', '', 'begini'),
-            ('', 'kayak', '', '', 'seperti'),
-            ('', 'kaya', '', '', 'seperti'),
-            ('', 'macam', '', '', 'seperti'),
-            ('', 'banget', '', '', 'sangat'),
-            ('', 'bgt', '', '', 'sangat'),
-            ('', 'bener', '', '', 'benar'),
-            ('', 'emang', '', '', 'memang'),
-            ('', 'memang', '', '', 'memang'),
-
-            # Numbers and time expressions
-            ('one', 'satu', 'siji', 'hiji', 'satu'),
-            ('two', 'dua', 'loro', 'dua', 'dua'),
-            ('three', 'tiga', 'telu', 'tilu', 'tiga'),
-            ('four', 'empat', 'papat', 'opat', 'empat'),
-            ('five', 'lima', 'lima', 'lima', 'lima'),
-            ('six', 'enam', 'enem', 'genep', 'enam'),
-            ('seven', 'tujuh', 'pitu', 'tujuh', 'tujuh'),
-            ('eight', 'delapan', 'wolu', 'dalapan', 'delapan'),
-            ('nine', 'sembilan', 'sanga', 'salapan', 'sembilan'),
-            ('ten', 'sepuluh', 'sepuluh', 'sapuluh', 'sepuluh'),
-            ('today', 'hari ini', 'dina iki', 'dinten ieu', 'hari ini'),
-            ('tomorrow', 'besok', 'sesuk', 'isukan', 'besok'),
-            ('yesterday', 'kemarin', 'wingi', 'kamari', 'kemarin'),
-            ('morning', 'pagi', 'esuk', 'isuk', 'pagi'),
-            ('afternoon', 'siang', 'awan', 'siang', 'siang'),
-            ('evening', 'sore', 'sore', 'sonten', 'sore'),
-            ('night', 'malam', 'bengi', 'wengi', 'malam'),
-
-            # More social media terms and internet slang
-            ('', 'wkwkwkwk', '', '', 'hahaha'),
-            ('', 'wkwkland', '', '', 'indonesia'),
-            ('', 'xixi', '', '', 'hehe'),
-            ('', 'xixixixi', '', '', 'hehehe'),
-            ('', 'kwkwkw', '', '', 'hahaha'),
-            ('', 'wakaka', '', '', 'hahaha'),
-            ('', 'wakakaka', '', '', 'hahaha'),
-            ('', 'hahaha', '', '', 'hahaha'),
-            ('', 'hehehe', '', '', 'hehehe'),
-            ('', 'hihi', '', '', 'hihi'),
-            ('', 'hoho', '', '', 'hoho'),
-            ('', 'huhu', '', '', 'huhu'),
-            ('', 'wkwk', '', '', 'haha'),
-            ('', 'kwkw', '', '', 'haha'),
-            ('', 'kkkk', '', '', 'haha'),
-            ('', 'kkkkk', '', '', 'hahaha'),
-            ('', 'wkakaka', '', '', 'hahaha'),
-            ('', 'wakwaw', '', '', 'haha'),
-            ('', 'wkwkwk', '', '', 'hahaha'),
-
-            # More Indonesian formal and colloquial
-            ('', 'sekarang', '', '', 'sekarang'),
-            ('', 'skrg', '', '', 'sekarang'),
-            ('', 'skrang', '', '', 'sekarang'),
-            ('', 'nanti', '', '', 'nanti'),
-            ('', 'ntar', '', '', 'nanti'),
-            ('', 'tar', '', '', 'nanti'),
-            ('', 'tadi', '', '', 'tadi'),
-            ('', 'td', '', '', 'tadi'),
-            ('', 'kemarin', '', '', 'kemarin'),
-            ('', 'kmrn', '', '', 'kemarin'),
-            ('', 'besok', '', '', 'besok'),
-            ('', 'bsk', '', '', 'besok'),
-            ('', 'lusa', '', '', 'lusa'),
-            ('', 'minggu', '', '', 'minggu'),
-            ('', 'mgg', '', '', 'minggu'),
-            ('', 'bulan', '', '', 'bulan'),
-            ('', 'bln', '', '', 'bulan'),
-            ('', 'tahun', '', '', 'tahun'),
-            ('', 'thn', '', '', 'tahun'),
-            ('', 'hari', '', '', 'hari'),
-            ('', 'hr', '', '', 'hari'),
-            ('', 'jam', '', '', 'jam'),
-            ('', 'menit', '', '', 'menit'),
-            ('', 'mnt', '', '', 'menit'),
-            ('', 'detik', '', '', 'detik'),
-            ('', 'dtk', '', '', 'detik'),
-
-            # More Javanese terms
-            ('', '', 'aku', '', 'saya'),
-            ('', '', 'kowe', '', 'kamu'),
-            ('', '', 'dheweke', '', 'dia'),
-            ('', '', 'awakmu', '', 'kamu'),
-            ('', '', 'awakne', '', 'dia'),
-            ('', '', 'iki', '', 'ini'),
-            ('', '', 'iku', '', 'itu'),
-            ('', '', 'kene', '', 'sini'),
-            ('', '', 'kono', '', 'sana'),
-            ('', '', 'ngendi', '', 'dimana'),
-            ('', '', 'piye', '', 'bagaimana'),
-            ('', '', 'apa', '', 'apa'),
-            ('', '', 'sapa', '', 'siapa'),
-            ('', '', 'kapan', '', 'kapan'),
-            ('', '', 'ngapa', '', 'kenapa'),
-            ('', '', 'ning', '', 'di'),
-            ('', '', 'nang', '', 'di'),
-            ('', '', 'menyang', '', 'ke'),
-            ('', '', 'saka', '', 'dari'),
-            ('', '', 'kanggo', '', 'untuk'),
-            ('', '', 'karo', '', 'dengan'),
-            ('', '', 'lan', '', 'dan'),
-            ('', '', 'utawa', '', 'atau'),
-            ('', '', 'nanging', '', 'tetapi'),
-            ('', '', 'merga', '', 'karena'),
-            ('', '', 'yen', '', 'jika'),
-            ('', '', 'nalika', '', 'ketika'),
-            ('', '', 'arep', '', 'akan'),
-            ('', '', 'wis', '', 'sudah'),
-            ('', '', 'lagi', '', 'sedang'),
-            ('', '', 'isih', '', 'masih'),
-            ('', '', 'durung', '', 'belum'),
-            ('', '', 'ora', '', 'tidak'),
-            ('', '', 'dudu', '', 'bukan'),
-            ('', '', 'ana', '', 'ada'),
-            ('', '', 'ora ana', '', 'tidak ada'),
-            ('', '', 'kabeh', '', 'semua'),
-            ('', '', 'akeh', '', 'banyak'),
-            ('', '', 'sithik', '', 'sedikit'),
-            ('', '', 'banget', '', 'sangat'),
-            ('', '', 'apik', '', 'bagus'),
-            ('', '', 'elek', '', 'jelek'),
-            ('', '', 'gedhe', '', 'besar'),
-            ('', '', 'cilik', '', 'kecil'),
-            ('', '', 'dawa', '', 'panjang'),
-            ('', '', 'cendhak', '', 'pendek'),
-
-            # More Sundanese terms
-            ('', '', '', 'abdi', 'saya'),
-            ('', '', '', 'anjeun', 'kamu'),
-            ('', '', '', 'anjeunna', 'dia'),
-            ('', '', '', 'ieu', 'ini'),
-            ('', '', '', 'eta', 'itu'),
-            ('', '', '', 'dieu', 'sini'),
-            ('', '', '', 'dinya', 'sana'),
-            ('', '', '', 'dimana', 'dimana'),
-            ('', '', '', 'kumaha', 'bagaimana'),
-            ('', '', '', 'naon', 'apa'),
-            ('', '', '', 'saha', 'siapa'),
-            ('', '', '', 'iraha', 'kapan'),
-            ('', '', '', 'naha', 'kenapa'),
-            ('', '', '', 'di', 'di'),
-            ('', '', '', 'ka', 'ke'),
-            ('', '', '', 'ti', 'dari'),
-            ('', '', '', 'pikeun', 'untuk'),
-            ('', '', '', 'sareng', 'dengan'),
-            ('', '', '', 'jeung', 'dan'),
-            ('', '', '', 'atawa', 'atau'),
-            ('', '', '', 'tapi', 'tetapi'),
-            ('', '', '', 'sabab', 'karena'),
-            ('', '', '', 'lamun', 'jika'),
-            ('', '', '', 'nalika', 'ketika'),
-            ('', '', '', 'bade', 'akan'),
-            ('', '', '', 'parantos', 'sudah'),
-            ('', '', '', 'nuju', 'sedang'),
-            ('', '', '', 'masih', 'masih'),
-            ('', '', '', 'can', 'belum'),
-            ('', '', '', 'henteu', 'tidak'),
-            ('', '', '', 'sanés', 'bukan'),
-            ('', '', '', 'aya', 'ada'),
-            ('', '', '', 'teu aya', 'tidak ada'),
-            ('', '', '', 'sadaya', 'semua'),
-            ('', '', '', 'seueur', 'banyak'),
-            ('', '', '', 'saeutik', 'sedikit'),
-            ('', '', '', 'pisan', 'sangat'),
-            ('', '', '', 'saé', 'bagus'),
-            ('', '', '', 'awon', 'jelek'),
-            ('', '', '', 'ageung', 'besar'),
-            ('', '', '', 'alit', 'kecil'),
-            ('', '', '', 'panjang', 'panjang'),
-            ('', '', '', 'pondok', 'pendek'),
-
-            # Additional common words
-            ('good', 'bagus', 'apik', 'saé', 'bagus'),
-            ('bad', 'buruk', 'elek', 'awon', 'buruk'),
-            ('big', 'besar', 'gedhe', 'ageung', 'besar'),
-            ('small', 'kecil', 'cilik', 'alit', 'kecil'),
-            ('long', 'panjang', 'dawa', 'panjang', 'panjang'),
-            ('short', 'pendek', 'cendhak', 'pondok', 'pendek'),
-            ('new', 'baru', 'anyar', 'anyar', 'baru'),
-            ('old', 'lama', 'lawas', 'lami', 'lama'),
-            ('young', 'muda', 'enom', 'ngora', 'muda'),
-            ('fast', 'cepat', 'cepet', 'gancang', 'cepat'),
-            ('slow', 'lambat', 'alon', 'laun', 'lambat'),
-            ('hot', 'panas', 'panas', 'panas', 'panas'),
-            ('cold', 'dingin', 'adhem', 'tiis', 'dingin'),
-            ('warm', 'hangat', 'anget', 'haneut', 'hangat'),
-            ('cool', 'sejuk', 'adem', 'tiis', 'sejuk'),
-            ('wet', 'basah', 'teles', 'baseuh', 'basah'),
-            ('dry', 'kering', 'garing', 'garing', 'kering'),
-            ('clean', 'bersih', 'resik', 'beresih', 'bersih'),
-            ('dirty', 'kotor', 'reged', 'kotor', 'kotor'),
-            ('easy', 'mudah', 'gampang', 'gampil', 'mudah'),
-            ('hard', 'sulit', 'angel', 'hese', 'sulit'),
-            ('light', 'ringan', 'entheng', 'hampang', 'ringan'),
-            ('heavy', 'berat', 'abot', 'beurat', 'berat'),
-            ('high', 'tinggi', 'dhuwur', 'luhur', 'tinggi'),
-            ('low', 'rendah', 'cendhek', 'handap', 'rendah'),
-            ('near', 'dekat', 'cedhak', 'deukeut', 'dekat'),
-            ('far', 'jauh', 'adoh', 'jauh', 'jauh'),
-            ('left', 'kiri', 'kiwa', 'kénca', 'kiri'),
-            ('right', 'kanan', 'tengen', 'katuhu', 'kanan'),
-            ('front', 'depan', 'ngarep', 'hareupeun', 'depan'),
-            ('back', 'belakang', 'mburi', 'tukang', 'belakang'),
-            ('up', 'atas', 'dhuwur', 'luhur', 'atas'),
-            ('down', 'bawah', 'ngisor', 'handap', 'bawah'),
-            ('first', 'pertama', 'pisanan', 'kahiji', 'pertama'),
-            ('last', 'terakhir', 'pungkasan', 'panungtungan', 'terakhir'),
-            ('next', 'berikutnya', 'sabanjure', 'salajengna', 'berikutnya'),
-            ('previous', 'sebelumnya', 'sadurunge', 'sateuacanna', 'sebelumnya'),
-            ('same', 'sama', 'padha', 'sarua', 'sama'),
-            ('different', 'berbeda', 'beda', 'béda', 'berbeda'),
-            ('true', 'benar', 'bener', 'leres', 'benar'),
-            ('false', 'salah', 'salah', 'lepat', 'salah'),
-            ('yes', 'ya', 'iya', 'enya', 'ya'),
-            ('no', 'tidak', 'ora', 'henteu', 'tidak'),
-            ('maybe', 'mungkin', 'mbok menawa', 'meureun', 'mungkin'),
-            ('sure', 'pasti', 'mesthi', 'pasti', 'pasti'),
-            ('never', 'tidak pernah', 'ora tau', 'henteu kantos', 'tidak pernah'),
-            ('always', 'selalu', 'tansah', 'salawasna', 'selalu'),
-            ('sometimes', 'kadang', 'kadhang', 'sakapeung', 'kadang'),
-            ('often', 'sering', 'kerep', 'mindeng', 'sering'),
-            ('rarely', 'jarang', 'arang', 'jarang', 'jarang'),
-            ('usually', 'biasanya', 'biasane', 'biasana', 'biasanya'),
-            ('normally', 'normalnya', 'lumrahe', 'biasana', 'normalnya'),
-            ('really', 'benar-benar', 'tenan', 'leres-leres', 'benar-benar'),
-            ('actually', 'sebenarnya', 'sejatine', 'saleresna', 'sebenarnya'),
-            ('probably', 'mungkin', 'mbok menawa', 'sigana', 'mungkin'),
-            ('definitely', 'pasti', 'mesthi', 'pasti', 'pasti'),
-            ('certainly', 'tentu', 'mesthi', 'tangtu', 'tentu'),
-            ('absolutely', 'mutlak', 'mutlak', 'mutlak', 'mutlak'),
-            ('completely', 'sepenuhnya', 'sakabehe', 'lengkep', 'sepenuhnya'),
-            ('totally', 'total', 'total', 'total', 'total'),
-            ('exactly', 'persis', 'persis', 'persis', 'persis'),
-            ('almost', 'hampir', 'meh', 'ampir', 'hampir'),
-            ('quite', 'cukup', 'cukup', 'cukup', 'cukup'),
-            ('rather', 'agak', 'rada', 'rada', 'agak'),
-            ('pretty', 'cukup', 'lumayan', 'lumayan', 'cukup'),
-            ('fairly', 'cukup', 'lumayan', 'lumayan', 'cukup'),
-            ('extremely', 'sangat', 'banget', 'pisan', 'sangat'),
-            ('incredibly', 'luar biasa', 'luar biasa', 'luar biasa', 'luar biasa'),
-            ('amazingly', 'menakjubkan', 'nggumunake', 'endah', 'menakjubkan'),
-            ('surprisingly', 'mengejutkan', 'nggumunake', 'héran', 'mengejutkan'),
-        ]
-
-        # Add entries until we reach 1500
-        for entry in additional_words:
-            self.add_stopword_entry(*entry)
-            if len(self.stopwords_data) >= 1500:
-                break
+        """Add more entries towards the target entry count"""
+        self.add_stopword_entries(ADDITIONAL_WORDS)
 
-        # If still not enough, add more variations
-        if len(self.stopwords_data) < 1500:
-            self.add_even_more_entries()
+        # Add more variations
+        self.add_even_more_entries()
 
     def load_nusax_dataset(self):
         """Load NusaX-senti dataset for extracting authentic multilingual stopwords"""
@@ -854,9 +989,17 @@ class MultilingualStopwordGenerator:
             self.nusax_data = {}
             languages = ['ind', 'jav', 'sun', 'eng']  # Focus on main languages we need
 
-            for lang in languages:
+            # Subsets load independently over the network, so fetch them concurrently.
+            # Stream rows instead of materializing every split; they are only iterated once
+            with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+                futures = {
+                    lang: executor.submit(load_dataset, "indonlp/NusaX-senti", lang, streaming=True)
+                    for lang in languages
+                }
+
+            for lang, future in futures.items():
                 try:
-                    self.nusax_data[lang] = load_dataset("indonlp/NusaX-senti", lang)
+                    self.nusax_data[lang] = future.result()
                     logger.info(f"Loaded {lang} subset successfully")
                 except Exception as e:
                     logger.warning(f"Could not load {lang} subset: {e}")
@@ -893,230 +1036,66 @@ class MultilingualStopwordGenerator:
                     # Get data for this language and split
                     data = dataset[split]
 
-                    # Process each text sample
-                    for sample in data:
-                        text = sample['text'].lower()
-                        # Simple tokenization - split by whitespace and remove punctuation
-                        words = re.findall(r'\b[a-zA-ZÀ-ÿ]+\b', text)  # Include accented characters
-                        word_frequency[lang_code].update(words)
+                    # Tokenize every text sample and count the whole split in one update
+                    words = chain.from_iterable(
+                        TOKEN_PATTERN.findall(sample['text'].lower()) for sample in data
+                    )
+                    word_frequency[lang_code].update(words)
 
                 except Exception as e:
                     logger.warning(f"Error processing {lang_code} {split}: {e}")
                     continue
 
+            # Drop rare words once this language is fully counted; they can never pass
+            # the count > 3 filter below. Peak memory while counting is unchanged, but
+            # the rare tail is freed before the next language is processed
+            word_frequency[lang_code] = Counter(
+                {word: count for word, count in word_frequency[lang_code].items() if count > 3}
+            )
+
+        # Row builders mapping a common word to (en, id, jv, su, formal_id) per language,
+        # chosen once per language instead of branching on every word
+        entry_builders = {
+            'eng': lambda word: (word, '', '', '', ''),
+            # Try to find equivalents in Javanese and Sundanese
+            'ind': lambda word: ('', word, *self.formal_to_jvsu.get(word, ('', '')), word),
+            # Find Indonesian equivalent if possible
+            'jav': lambda word: ('', self.jv_to_formal.get(word, ''), word, '', self.jv_to_formal.get(word, '')),
+            'sun': lambda word: ('', self.su_to_formal.get(word, ''), '', word, self.su_to_formal.get(word, '')),
+        }
+
         # Extract most common words as potential stopwords
         for lang_code, freq_counter in word_frequency.items():
             # Get top 100 most common words for each language
             common_words = [word for word, count in freq_counter.most_common(100)
                           if len(word) > 1 and count > 3]  # Filter short words and rare words
 
-            logger.info(f"Found {len(common_words)} common words in {lang_code}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Found {len(common_words)} common words in {lang_code}")
 
             # Map to our column format
-            for word in common_words:
-                if lang_code == 'eng':
-                    self.add_stopword_entry(word, '', '', '', '')
-                elif lang_code == 'ind':
-                    # Try to find equivalents in Javanese and Sundanese
-                    jv_word = self.javanese_mappings.get(word, '')
-                    su_word = self.sundanese_mappings.get(word, '')
-                    self.add_stopword_entry('', word, jv_word, su_word, word)
-                elif lang_code == 'jav':
-                    # Find Indonesian equivalent if possible
-                    id_word = ''
-                    formal_id = ''
-                    for id_key, jv_val in self.javanese_mappings.items():
-                        if jv_val == word:
-                            id_word = id_key
-                            formal_id = id_key
-                            break
-                    self.add_stopword_entry('', id_word, word, '', formal_id)
-                elif lang_code == 'sun':
-                    # Find Indonesian equivalent if possible
-                    id_word = ''
-                    formal_id = ''
-                    for id_key, su_val in self.sundanese_mappings.items():
-                        if su_val == word:
-                            id_word = id_key
-                            formal_id = id_key
-                            break
-                    self.add_stopword_entry('', id_word, '', word, formal_id)
-                else:
-                    # For other languages (like Acehnese), add as additional data
-                    self.add_stopword_entry('', '', '', '', word)
+            # For other languages (like Acehnese), add as additional data
+            build_entry = entry_builders.get(lang_code, lambda word: ('', '', '', '', word))
+            self.add_stopword_entries([build_entry(word) for word in common_words])
 
         logger.info("Finished extracting stopwords from NusaX dataset")
 
     def add_even_more_entries(self):
-        """Add even more entries to ensure we reach 1500"""
-        # Generate more variations and combinations
-        more_entries = []
-
-        # Add more Indonesian internet slang and abbreviations
-        internet_slang = [
-            ('', 'ygy', '', '', 'ya guys ya'),
-            ('', 'yg', '', '', 'yang'),
-            ('', 'sy', '', '', 'saya'),
-            ('', 'km', '', '', 'kamu'),
-            ('', 'dy', '', '', 'dia'),
-            ('', 'mrk', '', '', 'mereka'),
-            ('', 'kt', '', '', 'kita'),
-            ('', 'kmi', '', '', 'kami'),
-            ('', 'ini', '', '', 'ini'),
-            ('', 'itu', '', '', 'itu'),
-            ('', 'dan', '', '', 'dan'),
-            ('', 'atau', '', '', 'atau'),
-            ('', 'tp', '', '', 'tetapi'),
-            ('', 'krn', '', '', 'karena'),
-            ('', 'jk', '', '', 'jika'),
-            ('', 'ktk', '', '', 'ketika'),
-            ('', 'saat', '', '', 'saat'),
-            ('', 'wkt', '', '', 'waktu'),
-            ('', 'di', '', '', 'di'),
-            ('', 'ke', '', '', 'ke'),
-            ('', 'dr', '', '', 'dari'),
-            ('', 'utk', '', '', 'untuk'),
-            ('', 'dgn', '', '', 'dengan'),
-            ('', 'pd', '', '', 'pada'),
-            ('', 'dlm', '', '', 'dalam'),
-            ('', 'olh', '', '', 'oleh'),
-            ('', 'adlh', '', '', 'adalah'),
-            ('', 'akn', '', '', 'akan'),
-            ('', 'tlh', '', '', 'telah'),
-            ('', 'sdh', '', '', 'sudah'),
-            ('', 'sdg', '', '', 'sedang'),
-            ('', 'msh', '', '', 'masih'),
-            ('', 'blm', '', '', 'belum'),
-            ('', 'tdk', '', '', 'tidak'),
-            ('', 'bkn', '', '', 'bukan'),
-            ('', 'jgn', '', '', 'jangan'),
-            ('', 'ada', '', '', 'ada'),
-            ('', 'smu', '', '', 'semua'),
-            ('', 'stp', '', '', 'setiap'),
-            ('', 'bbp', '', '', 'beberapa'),
-            ('', 'bnyk', '', '', 'banyak'),
-            ('', 'sdkt', '', '', 'sedikit'),
-            ('', 'sgt', '', '', 'sangat'),
-            ('', 'agk', '', '', 'agak'),
-            ('', 'ckp', '', '', 'cukup'),
-            ('', 'tll', '', '', 'terlalu'),
-            ('', 'plg', '', '', 'paling'),
-            ('', 'lbh', '', '', 'lebih'),
-            ('', 'krg', '', '', 'kurang'),
-        ]
-
-        # Add more emotional expressions and reactions
-        emotions = [
-            ('', 'huft', '', '', ''),
-            ('', 'hufh', '', '', ''),
-            ('', 'hufft', '', '', ''),
-            ('', 'haah', '', '', ''),
-            ('', 'haaah', '', '', ''),
-            ('', 'aaah', '', '', ''),
-            ('', 'oooh', '', '', ''),
-            ('', 'uuuh', '', '', ''),
-            ('', 'eeeh', '', '', ''),
-            ('', 'iiih', '', '', ''),
-            ('', 'owh', '', '', ''),
-            ('', 'owwh', '', '', ''),
-            ('', 'owwwh', '', '', ''),
-            ('', 'hehe', '', '', ''),
-            ('', 'hihi', '', '', ''),
-            ('', 'hoho', '', '', ''),
-            ('', 'huhu', '', '', ''),
-            ('', 'haha', '', '', ''),
-            ('', 'hehe', '', '', ''),
-            ('', 'xixi', '', '', ''),
-            ('', 'keke', '', '', ''),
-            ('', 'gege', '', '', ''),
-            ('', 'wkwk', '', '', ''),
-            ('', 'kwkw', '', '', ''),
-            ('', 'wakaka', '', '', ''),
-            ('', 'wkakaka', '', '', ''),
-            ('', 'wakakaka', '', '', ''),
-            ('', 'wkwkwk', '', '', ''),
-            ('', 'wkwkwkwk', '', '', ''),
-            ('', 'kwkwkw', '', '', ''),
-            ('', 'kwkwkwkw', '', '', ''),
-        ]
-
-        # Add more question words and variations
-        questions = [
-            ('', 'gimana', '', '', 'bagaimana'),
-            ('', 'gmn', '', '', 'bagaimana'),
-            ('', 'bgmn', '', '', 'bagaimana'),
-            ('', 'kenapa', '', '', 'kenapa'),
-            ('', 'knp', '', '', 'kenapa'),
-            ('', 'knapa', '', '', 'kenapa'),
-            ('', 'mengapa', '', '', 'mengapa'),
-            ('', 'dimana', '', '', 'dimana'),
-            ('', 'dmn', '', '', 'dimana'),
-            ('', 'dmana', '', '', 'dimana'),
-            ('', 'kemana', '', '', 'kemana'),
-            ('', 'kmn', '', '', 'kemana'),
-            ('', 'kmana', '', '', 'kemana'),
-            ('', 'darimana', '', '', 'darimana'),
-            ('', 'drmn', '', '', 'darimana'),
-            ('', 'drmana', '', '', 'darimana'),
-            ('', 'siapa', '', '', 'siapa'),
-            ('', 'spa', '', '', 'siapa'),
-            ('', 'sapa', '', '', 'siapa'),
-            ('', 'apa', '', '', 'apa'),
-            ('', 'apaan', '', '', 'apa'),
-            ('', 'apain', '', '', 'apa'),
-            ('', 'mana', '', '', 'mana'),
-            ('', 'mn', '', '', 'mana'),
-            ('', 'kapan', '', '', 'kapan'),
-            ('', 'kpn', '', '', 'kapan'),
-            ('', 'kpan', '', '', 'kapan'),
-        ]
-
-        # Add more time-related expressions
-        time_expressions = [
-            ('', 'sekarang', '', '', 'sekarang'),
-            ('', 'skrg', '', '', 'sekarang'),
-            ('', 'skrang', '', '', 'sekarang'),
-            ('', 'nanti', '', '', 'nanti'),
-            ('', 'ntar', '', '', 'nanti'),
-            ('', 'tar', '', '', 'nanti'),
-            ('', 'tadi', '', '', 'tadi'),
-            ('', 'td', '', '', 'tadi'),
-            ('', 'barusan', '', '', 'baru saja'),
-            ('', 'brsan', '', '', 'baru saja'),
-            ('', 'baru', '', '', 'baru'),
-            ('', 'br', '', '', 'baru'),
-            ('', 'lama', '', '', 'lama'),
-            ('', 'lm', '', '', 'lama'),
-            ('', 'cepat', '', '', 'cepat'),
-            ('', 'cpat', '', '', 'cepat'),
-            ('', 'cpt', '', '', 'cepat'),
-            ('', 'lambat', '', '', 'lambat'),
-            ('', 'lmbt', '', '', 'lambat'),
-            ('', 'pelan', '', '', 'pelan'),
-            ('', 'pln', '', '', 'pelan'),
-        ]
-
-        # Combine all additional entries
-        more_entries.extend(internet_slang)
-        more_entries.extend(emotions)
-        more_entries.extend(questions)
-        more_entries.extend(time_expressions)
-
-        # Add entries until we reach 1500
-        for entry in more_entries:
-            if len(self.stopwords_data) >= 1500:
-                break
-            self.add_stopword_entry(*entry)
+        """Add even more entries towards the target entry count"""
+        self.add_stopword_entries(INTERNET_SLANG)
+        self.add_stopword_entries(EMOTIONS)
+        self.add_stopword_entries(QUESTIONS)
+        self.add_stopword_entries(TIME_EXPRESSIONS)
 
     def save_to_csv(self, filename='multilingual_stopwords_socialmedia.csv'):
         """Save the dataset to CSV file"""
         logger.info(f"Saving dataset to {filename}...")
 
-        # Convert to DataFrame
-        df = pd.DataFrame(self.stopwords_data)
+        # Convert to DataFrame; the columns are already in output order
+        df = pd.DataFrame(self.stopwords_data, columns=COLUMNS)
 
-        # Reorder columns to match requirements
-        df = df[['en', 'id', 'jv', 'su', 'formal_id']]
+        # formal_id has few distinct values, so store it as a categorical
+        df['formal_id'] = df['formal_id'].astype('category')
 
         # Save to CSV
         df.to_csv(filename, index=False, encoding='utf-8')
@@ -1131,6 +1110,28 @@ class MultilingualStopwordGenerator:
 
         return df
 
+    def save_automaton(self, filename='multilingual_stopwords_socialmedia.aho'):
+        """Save an Aho-Corasick automaton over all stopwords for single-pass text matching"""
+        try:
+            import ahocorasick
+        except ImportError:
+            logger.warning("pyahocorasick not installed, skipping automaton export")
+            return None
+
+        logger.info(f"Building Aho-Corasick automaton to {filename}...")
+
+        # Each word maps to the (row index, column) of its first occurrence
+        automaton = ahocorasick.Automaton()
+        for i, row in enumerate(zip(*(self.stopwords_data[col] for col in COLUMNS))):
+            for lang, word in zip(COLUMNS, row):
+                if word and word not in automaton:
+                    automaton.add_word(word, (i, lang))
+        automaton.make_automaton()
+        automaton.save(filename, pickle.dumps)
+
+        logger.info(f"Automaton saved successfully to {filename} ({len(automaton)} words)")
+        return automaton
+
 
 def main():
     """Main function to generate the multilingual stopword dataset"""
@@ -1143,18 +1144,20 @@ def main():
 
         # Save to CSV
         df = generator.save_to_csv()
+        generator.save_automaton()
 
         print(f"\n✅ Successfully generated multilingual stopword dataset!")
         print(f"📊 Total entries: {len(df)}")
         print(f"📁 Saved to: multilingual_stopwords_socialmedia.csv")
 
         # Show statistics
+        counts = (df != '').sum(axis=0)
         print(f"\n📈 Statistics:")
-        print(f"   - English entries: {len(df[df['en'] != ''])}")
-        print(f"   - Indonesian entries: {len(df[df['id'] != ''])}")
-        print(f"   - Javanese entries: {len(df[df['jv'] != ''])}")
-        print(f"   - Sundanese entries: {len(df[df['su'] != ''])}")
-        print(f"   - Formal Indonesian entries: {len(df[df['formal_id'] != ''])}")
+        print(f"   - English entries: {counts['en']}")
+        print(f"   - Indonesian entries: {counts['id']}")
+        print(f"   - Javanese entries: {counts['jv']}")
+        print(f"   - Sundanese entries: {counts['su']}")
+        print(f"   - Formal Indonesian entries: {counts['formal_id']}")
 
     except Exception as e:
         logger.error(f"Error generating dataset: {e}")
@@ -3,12 +3,30 @@
 Script to integrate colloquial Indonesian vocabulary into our enhanced stopwords dataset.
 """
 
+import os
 import pandas as pd
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = 'string'
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Column types of the colloquial_<category>.csv files, so pandas skips type inference
+CATEGORY_DTYPES = {'slang': str, 'formal': str, 'category': str, 'length': 'int32'}
+
+# Columns of the multilingual stopword datasets
+STOPWORD_COLUMNS = ['en', 'id', 'jv', 'su', 'formal_id']
+
+# Formal words kept from the particles and adverbs categories
+PARTICLE_KEEP = frozenset({'yang', 'saja', 'juga', 'hanya', 'dengan', 'untuk', 'dari', 'pada'})
+ADVERB_KEEP = frozenset({'banget', 'sangat', 'sekali', 'agak', 'cukup', 'terlalu'})
+
 def load_colloquial_candidates():
     """Load colloquial stopword candidates"""
     try:
@@ -19,54 +37,66 @@ def load_colloquial_candidates():
         logging.error("Colloquial candidates file not found!")
         return None
 
+def load_category_file(category):
+    """Load a colloquial category file"""
+    return pd.read_csv(f'colloquial_{category}.csv', dtype=CATEGORY_DTYPES)
+
 def filter_high_value_candidates(candidates_df):
     """Filter for high-value colloquial stopwords"""
     
     # Priority categories for stopwords
     high_priority_categories = ['particles', 'pronouns', 'conjunctions', 'adverbs', 'question_words', 'demonstratives']
     
-    # Load category-specific files
-    high_value_candidates = []
-    
+    # Skip missing category files up front so only existing files are loaded
+    available_categories = []
     for category in high_priority_categories:
-        try:
-            category_df = pd.read_csv(f'colloquial_{category}.csv')
-            
-            # Filter based on category-specific criteria
-            if category == 'particles':
-                # Include short particles and common function words
-                filtered = category_df[
-                    (category_df['length'] <= 3) | 
-                    (category_df['formal'].isin(['yang', 'saja', 'juga', 'hanya', 'dengan', 'untuk', 'dari', 'pada']))
-                ]
-            elif category == 'pronouns':
-                # Include all pronouns
-                filtered = category_df
-            elif category == 'conjunctions':
-                # Include all conjunctions
-                filtered = category_df
-            elif category == 'adverbs':
-                # Focus on intensity adverbs
-                filtered = category_df[
-                    category_df['formal'].isin(['banget', 'sangat', 'sekali', 'agak', 'cukup', 'terlalu'])
-                ]
-            elif category == 'question_words':
-                # Include all question words
-                filtered = category_df
-            elif category == 'demonstratives':
-                # Include all demonstratives
-                filtered = category_df
-            
-            # Add category label
-            filtered = filtered.copy()
-            filtered['priority_category'] = category
-            high_value_candidates.append(filtered)
-            
-            logging.info(f"Selected {len(filtered)} candidates from {category}")
-            
-        except FileNotFoundError:
+        if os.path.isfile(f'colloquial_{category}.csv'):
+            available_categories.append(category)
+        else:
             logging.warning(f"Category file for {category} not found")
     
+    # Load category-specific files concurrently
+    category_dfs = {}
+    if available_categories:
+        with ThreadPoolExecutor(max_workers=len(available_categories)) as executor:
+            category_dfs = dict(zip(available_categories,
+                                    executor.map(load_category_file, available_categories)))
+    
+    high_value_candidates = []
+    
+    for category, category_df in category_dfs.items():
+        # Filter based on category-specific criteria
+        if category == 'particles':
+            # Include short particles and common function words
+            filtered = category_df[
+                (category_df['length'] <= 3) | 
+                (category_df['formal'].isin(PARTICLE_KEEP))
+            ]
+        elif category == 'pronouns':
+            # Include all pronouns
+            filtered = category_df
+        elif category == 'conjunctions':
+            # Include all conjunctions
+            filtered = category_df
+        elif category == 'adverbs':
+            # Focus on intensity adverbs
+            filtered = category_df[
+                category_df['formal'].isin(ADVERB_KEEP)
+            ]
+        elif category == 'question_words':
+            # Include all question words
+            filtered = category_df
+        elif category == 'demonstratives':
+            # Include all demonstratives
+            filtered = category_df
+        
+        # Add category label
+        filtered = filtered.copy()
+        filtered['priority_category'] = category
+        high_value_candidates.append(filtered)
+        
+        logging.info(f"Selected {len(filtered)} candidates from {category}")
+    
     # Combine all high-value candidates
     if high_value_candidates:
         combined_df = pd.concat(high_value_candidates, ignore_index=True)
@@ -81,52 +111,45 @@ def integrate_with_enhanced_stopwords(colloquial_df):
     # Load existing enhanced stopwords
     try:
         existing_df = pd.read_csv('multilingual_stopwords_enhanced.csv')
+        # Arrow-backed strings make the emptiness and membership checks vectorized
+        existing_df = existing_df.astype({col: STRING_DTYPE for col in STOPWORD_COLUMNS})
         logging.info(f"Loaded existing enhanced stopwords: {len(existing_df)} entries")
     except FileNotFoundError:
         logging.error("Enhanced stopwords file not found!")
         return
     
-    # Prepare new entries from colloquial data
-    new_entries = []
-    existing_indonesian = set(existing_df['id'].dropna().str.strip().str.lower())
-    existing_formal = set(existing_df['formal_id'].dropna().str.strip().str.lower())
+    # Normalize existing and colloquial words once, column-wise
+    existing_indonesian = {word.strip().lower() for word in existing_df['id'].dropna().tolist()}
+    existing_formal = {word.strip().lower() for word in existing_df['formal_id'].dropna().tolist()}
     
-    added_count = 0
-    skipped_count = 0
+    slang = colloquial_df['slang'].astype(str).str.strip().str.lower()
+    formal = colloquial_df['formal'].astype(str).str.strip().str.lower()
     
-    for _, row in colloquial_df.iterrows():
-        slang = str(row['slang']).strip().lower()
-        formal = str(row['formal']).strip().lower()
-        
-        # Skip if either is invalid
-        if slang == 'nan' or formal == 'nan' or len(slang) == 0 or len(formal) == 0:
-            continue
-        
-        # Skip if slang already exists in dataset
-        if slang in existing_indonesian or slang in existing_formal:
-            skipped_count += 1
-            continue
-        
-        # Add slang term as Indonesian colloquial
-        new_entry = {
+    # Skip if either is invalid
+    valid = slang.ne('nan') & formal.ne('nan') & slang.str.len().gt(0) & formal.str.len().gt(0)
+    
+    # Skip if slang already exists in dataset
+    exists = slang.isin(existing_indonesian) | slang.isin(existing_formal)
+    new_mask = valid & ~exists
+    
+    added_count = int(new_mask.sum())
+    skipped_count = int((valid & exists).sum())
+    
+    if added_count:
+        # Add slang terms as Indonesian colloquial entries
+        new_df = pd.DataFrame({
             'en': '',
-            'id': slang,
+            'id': slang[new_mask].values,
             'jv': '',
             'su': '',
-            'formal_id': formal
-        }
-        new_entries.append(new_entry)
-        added_count += 1
-    
-    if new_entries:
-        # Create DataFrame for new entries
-        new_df = pd.DataFrame(new_entries)
+            'formal_id': formal[new_mask].values
+        })
         
-        # Combine with existing data
-        final_df = pd.concat([existing_df, new_df], ignore_index=True)
+        # Combine with existing data, reusing existing blocks where possible
+        final_df = pd.concat([existing_df, new_df], ignore_index=True, copy=False)
         
-        # Save final dataset
-        final_df.to_csv('multilingual_stopwords_final.csv', index=False)
+        # Save final dataset in chunks to cap writer memory
+        final_df.to_csv('multilingual_stopwords_final.csv', index=False, chunksize=50_000)
         
         logging.info(f"Final dataset saved with {len(final_df)} total entries")
         logging.info(f"Added {added_count} new colloquial stopwords")
@@ -147,8 +170,8 @@ def create_integration_summary(final_df, added_count, skipped_count, colloquial_
     su_count = final_df['su'].notna().sum()
     formal_id_count = final_df['formal_id'].notna().sum()
     
-    # Create summary
-    summary = f"""
+    # Create summary from parts joined once at the end
+    parts = [f"""
 COLLOQUIAL INDONESIAN INTEGRATION SUMMARY
 =========================================
 
@@ -167,26 +190,28 @@ Final Language Statistics:
 - Formal Indonesian entries: {formal_id_count}
 
 Colloquial Categories Integrated:
-"""
+"""]
     
     # Add category breakdown
     if 'priority_category' in colloquial_df.columns:
         category_counts = colloquial_df['priority_category'].value_counts()
         for category, count in category_counts.items():
-            summary += f"- {category.title()}: {count} terms\n"
+            parts.append(f"- {category.title()}: {count} terms\n")
     
-    summary += f"""
+    parts.append("""
 Sample New Colloquial Additions:
-"""
+""")
     
     # Show sample new entries (last added entries)
     if added_count > 0:
-        sample_entries = final_df.tail(min(20, added_count))
-        for i, (_, row) in enumerate(sample_entries.iterrows(), 1):
-            if pd.notna(row['id']) and row['id'] != '':
-                summary += f"  {i:2d}. {row['id']} -> {row['formal_id']}\n"
+        sample_entries = final_df.tail(min(20, added_count))[['id', 'formal_id']].reset_index(drop=True)
+        has_id = sample_entries['id'].notna() & sample_entries['id'].ne('')
+        parts.extend(
+            f"  {i + 1:2d}. {entry_id} -> {formal_id}\n"
+            for i, entry_id, formal_id in sample_entries[has_id].itertuples(name=None)
+        )
     
-    summary += f"""
+    parts.append("""
 Quality Improvements:
 ✅ Enhanced social media text preprocessing
 ✅ Better coverage of Indonesian internet slang
@@ -199,9 +224,9 @@ Usage Recommendations:
 - Apply to informal Indonesian text processing
 - Suitable for chat and messaging data
 - Ideal for youth-oriented content analysis
-"""
+""")
     
-    return summary
+    return ''.join(parts)
 
 def main():
     """Main function"""
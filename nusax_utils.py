@@ -5,29 +5,183 @@ This module provides functions to work with Indonesian, Javanese, and Sundanese
 
 import re
 import json
-from typing import Dict, List, Tuple, Optional
+import asyncio
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Tuple, Optional
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Word tokenizer used for language detection
+WORD_PATTERN = re.compile(r'\w+')
+
+# Precompiled patterns used by NusaXTextPreprocessor.clean_text
+URL_PATTERN = re.compile(r'https?://\S+')
+MENTION_PATTERN = re.compile(r'@\w+')
+HASHTAG_PATTERN = re.compile(r'#\w+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s.,!?-]')
+
+# Common marker words for each language
+LANGUAGE_MARKER_WORDS = {
+    'indonesian': frozenset(['yang', 'dan', 'ini', 'itu', 'dengan', 'untuk', 'dari', 'pada', 'dalam', 'tidak', 'adalah', 'akan', 'sudah', 'bisa', 'juga']),
+    'javanese': frozenset(['lan', 'karo', 'iki', 'kuwi', 'saka', 'kanggo', 'ing', 'ora', 'iku', 'wis', 'iso', 'uga']),
+    'sundanese': frozenset(['jeung', 'sareng', 'ieu', 'eta', 'ti', 'pikeun', 'di', 'henteu', 'teu', 'geus', 'tiasa', 'oge'])
+}
+
+# Common abbreviations and slang in Indonesian/regional languages
+ABBREVIATIONS = MappingProxyType({
+    'gk': 'tidak',
+    'ga': 'tidak', 
+    'gak': 'tidak',
+    'udh': 'sudah',
+    'udah': 'sudah',
+    'blm': 'belum',
+    'blom': 'belum',
+    'krn': 'karena',
+    'krna': 'karena',
+    'dgn': 'dengan',
+    'sm': 'sama',
+    'tp': 'tapi',
+    'trs': 'terus',
+    'yg': 'yang',
+    'utk': 'untuk',
+    'dr': 'dari',
+    'ke': 'ke',
+    'di': 'di',
+    'org': 'orang',
+    'bgt': 'banget',
+    'bener': 'benar',
+    'emg': 'memang',
+    'emang': 'memang'
+})
+
+# Emoticons and their sentiment
+EMOTICONS = MappingProxyType({
+    ':)': 'positive',
+    ':-)': 'positive', 
+    ':D': 'positive',
+    ':-D': 'positive',
+    ':P': 'positive',
+    ':(': 'negative',
+    ':-(': 'negative',
+    ':/': 'negative',
+    ':-/': 'negative',
+    ':\'(': 'negative'
+})
+
+# Single alternation of all emoticons, longest first so ':-)' is not read as ':)'
+EMOTICON_PATTERN = re.compile(
+    '|'.join(re.escape(emoticon) for emoticon in sorted(EMOTICONS, key=len, reverse=True))
+)
+
+@lru_cache(maxsize=4096)
+def _detect_scores(text_lower: str, word_sets: Tuple[frozenset, ...]) -> Tuple[float, ...]:
+    """
+    Score lowercased text against per-language marker word sets.
+    
+    Memoized, since corpora often repeat short texts and both
+    detect_language_mix and get_dominant_language score the same text.
+    
+    Args:
+        text_lower: Lowercased input text
+        word_sets: One set of marker words per language
+        
+    Returns:
+        Tuple of scores in the same order as word_sets
+    """
+    # Tokenize once; every language is then scored from the same token counts
+    tokens = WORD_PATTERN.findall(text_lower)
+    total_words = len(tokens)
+    if total_words == 0:
+        return (0,) * len(word_sets)
+    
+    counts = Counter(tokens)
+    return tuple(sum(counts[word] for word in words) / total_words for words in word_sets)
+
+# Tokens and marker words are compared by 64-bit hash in the batch kernel
+_HASH_MASK = 0xFFFFFFFFFFFFFFFF
+
+def _score_hashes(token_hashes: np.ndarray, offsets: np.ndarray, marker_hashes: np.ndarray,
+                  marker_lang_ids: np.ndarray, n_languages: int) -> np.ndarray:
+    """
+    Score hashed tokens of many texts against one sorted marker hash array.
+    
+    Args:
+        token_hashes: Hashes of all tokens, texts laid out back to back
+        offsets: Start offset of each text in token_hashes, plus the end offset
+        marker_hashes: Sorted hashes of all marker words
+        marker_lang_ids: Language index of each entry in marker_hashes
+        n_languages: Number of languages
+        
+    Returns:
+        Array of shape (len(offsets) - 1, n_languages) with scores per language
+    """
+    n_texts = offsets.shape[0] - 1
+    n_markers = marker_hashes.shape[0]
+    scores = np.zeros((n_texts, n_languages))
+    for i in range(n_texts):
+        start = offsets[i]
+        end = offsets[i + 1]
+        if end == start:
+            continue
+        for k in range(start, end):
+            value = token_hashes[k]
+            index = np.searchsorted(marker_hashes, value)
+            if index < n_markers and marker_hashes[index] == value:
+                scores[i, marker_lang_ids[index]] += 1
+        scores[i] /= end - start
+    return scores
+
+if njit is not None:
+    _score_hashes = njit(cache=True)(_score_hashes)
 
 class NusaXLanguageDetector:
     """Language detector specifically for NusaX supported languages."""
     
     def __init__(self):
-        # Common words and patterns for each language
-        self.language_patterns = {
-            'indonesian': {
-                'words': ['yang', 'dan', 'ini', 'itu', 'dengan', 'untuk', 'dari', 'pada', 'dalam', 'tidak', 'adalah', 'akan', 'sudah', 'bisa', 'juga'],
-                'patterns': [r'\byang\b', r'\bdan\b', r'\btidak\b', r'\badalah\b']
-            },
-            'javanese': {
-                'words': ['lan', 'karo', 'iki', 'kuwi', 'saka', 'kanggo', 'ing', 'ora', 'iku', 'wis', 'iso', 'uga'],
-                'patterns': [r'\blan\b', r'\bkaro\b', r'\bora\b', r'\biku\b']
-            },
-            'sundanese': {
-                'words': ['jeung', 'sareng', 'ieu', 'eta', 'ti', 'pikeun', 'di', 'henteu', 'teu', 'geus', 'tiasa', 'oge'],
-                'patterns': [r'\bjeung\b', r'\bsareng\b', r'\bhenteu\b', r'\bteu\b']
-            }
-        }
+        # Marker words are shared module-level constants, so instances only bind them
+        self.word_sets = LANGUAGE_MARKER_WORDS
+        
+        self.languages = list(self.word_sets)
+        self._word_sets = tuple(self.word_sets.values())
+        
+        # All marker words packed into one sorted array with a parallel language-id
+        # array (each marker word belongs to a single language), for batch scoring
+        lang_of = {word: j for j, words in enumerate(self._word_sets) for word in words}
+        self._markers = np.array(sorted(lang_of))
+        self._lang_id = np.array([lang_of[word] for word in self._markers], dtype=np.int8)
+        
+        # The same layout keyed by 64-bit word hash for the JIT-compiled batch kernel
+        hash_lang = sorted((hash(word) & _HASH_MASK, j) for word, j in lang_of.items())
+        self._marker_hashes = np.array([h for h, _ in hash_lang], dtype=np.uint64)
+        self._marker_hash_lang = np.array([j for _, j in hash_lang], dtype=np.int8)
     
     def detect_language_mix(self, text: str) -> Dict[str, float]:
         """
@@ -39,23 +193,60 @@ class NusaXLanguageDetector:
         Returns:
             Dictionary with language scores
         """
-        text_lower = text.lower()
-        scores = {'indonesian': 0, 'javanese': 0, 'sundanese': 0}
+        return dict(zip(self.languages, _detect_scores(text.lower(), self._word_sets)))
+    
+    def detect_language_mix_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Detect the mix of languages for many texts at once.
         
-        for lang, patterns in self.language_patterns.items():
-            # Count word matches
-            word_matches = sum(1 for word in patterns['words'] if word in text_lower)
-            
-            # Count pattern matches
-            pattern_matches = sum(1 for pattern in patterns['patterns'] if re.search(pattern, text_lower))
+        Args:
+            texts: Input texts
             
-            # Calculate score
-            total_words = len(text_lower.split())
-            if total_words > 0:
-                scores[lang] = (word_matches + pattern_matches) / total_words
+        Returns:
+            Array of shape (len(texts), 3) with scores per language,
+            columns ordered as in ``self.languages``
+        """
+        if njit is not None:
+            return self._detect_batch_jit(texts)
+        
+        token_lists = [WORD_PATTERN.findall(text.lower()) for text in texts]
+        lengths = np.fromiter(map(len, token_lists), dtype=np.int64, count=len(texts))
+        scores = np.zeros((len(texts), len(self.languages)))
+        if lengths.sum() == 0:
+            return scores
+        
+        # Look up every token of every text in the sorted marker array in one pass
+        tokens = np.array(list(chain.from_iterable(token_lists)))
+        row_ix = np.repeat(np.arange(len(texts)), lengths)
+        idx = np.minimum(np.searchsorted(self._markers, tokens), len(self._markers) - 1)
+        hit = self._markers[idx] == tokens
+        np.add.at(scores, (row_ix[hit], self._lang_id[idx[hit]]), 1)
         
+        np.divide(scores, lengths[:, None], out=scores, where=lengths[:, None] > 0)
         return scores
     
+    def _detect_batch_jit(self, texts: List[str]) -> np.ndarray:
+        """
+        Score many texts with the Numba kernel over hashed tokens.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            Array of shape (len(texts), 3) with scores per language
+        """
+        token_hashes = []
+        lengths = []
+        for text in texts:
+            tokens = WORD_PATTERN.findall(text.lower())
+            lengths.append(len(tokens))
+            token_hashes.extend(hash(token) & _HASH_MASK for token in tokens)
+        
+        offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return _score_hashes(np.array(token_hashes, dtype=np.uint64), offsets,
+                             self._marker_hashes, self._marker_hash_lang, len(self.languages))
+    
     def get_dominant_language(self, text: str) -> str:
         """
         Get the dominant language in the text.
@@ -66,54 +257,18 @@ class NusaXLanguageDetector:
         Returns:
             Dominant language name
         """
-        scores = self.detect_language_mix(text)
-        return max(scores, key=scores.get)
+        # Index the cached score tuple directly; ties go to the first language
+        scores = _detect_scores(text.lower(), self._word_sets)
+        return self.languages[max(range(len(scores)), key=scores.__getitem__)]
 
 class NusaXTextPreprocessor:
     """Text preprocessor for NusaX languages."""
     
     def __init__(self):
-        # Common abbreviations and slang in Indonesian/regional languages
-        self.abbreviations = {
-            'gk': 'tidak',
-            'ga': 'tidak', 
-            'gak': 'tidak',
-            'udh': 'sudah',
-            'udah': 'sudah',
-            'blm': 'belum',
-            'blom': 'belum',
-            'krn': 'karena',
-            'krna': 'karena',
-            'dgn': 'dengan',
-            'sm': 'sama',
-            'tp': 'tapi',
-            'trs': 'terus',
-            'yg': 'yang',
-            'utk': 'untuk',
-            'dr': 'dari',
-            'ke': 'ke',
-            'di': 'di',
-            'org': 'orang',
-            'bgt': 'banget',
-            'bgt': 'banget',
-            'bener': 'benar',
-            'emg': 'memang',
-            'emang': 'memang'
-        }
-        
-        # Emoticons and their sentiment
-        self.emoticons = {
-            ':)': 'positive',
-            ':-)': 'positive', 
-            ':D': 'positive',
-            ':-D': 'positive',
-            ':P': 'positive',
-            ':(': 'negative',
-            ':-(': 'negative',
-            ':/': 'negative',
-            ':-/': 'negative',
-            ':\'(': 'negative'
-        }
+        # Abbreviations and emoticons are shared module-level constants
+        self.abbreviations = ABBREVIATIONS
+        self.emoticons = EMOTICONS
+        self._emoticon_pattern = EMOTICON_PATTERN
     
     def expand_abbreviations(self, text: str) -> str:
         """
@@ -147,11 +302,8 @@ class NusaXTextPreprocessor:
         Returns:
             List of emoticons found
         """
-        found_emoticons = []
-        for emoticon in self.emoticons.keys():
-            if emoticon in text:
-                found_emoticons.append(emoticon)
-        return found_emoticons
+        # Unique emoticons in order of first appearance
+        return list(dict.fromkeys(self._emoticon_pattern.findall(text)))
     
     def clean_text(self, text: str) -> str:
         """
@@ -164,26 +316,51 @@ class NusaXTextPreprocessor:
             Cleaned text
         """
         # Convert to lowercase
-        text = text.lower()
-        
+        return self._clean_lowered(text.lower())
+    
+    def _clean_lowered(self, text: str) -> str:
+        """Run the cleaning steps of clean_text on already-lowercased text."""
         # Expand abbreviations
         text = self.expand_abbreviations(text)
         
         # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        text = URL_PATTERN.sub('', text)
         
         # Remove mentions and hashtags
-        text = re.sub(r'@\w+', '', text)
-        text = re.sub(r'#\w+', '', text)
+        text = MENTION_PATTERN.sub('', text)
+        text = HASHTAG_PATTERN.sub('', text)
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
         
         # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,!?-]', '', text)
+        text = SPECIAL_CHAR_PATTERN.sub('', text)
         
         return text.strip()
 
+def _items_at_prefix(data, prefix: str) -> List:
+    """
+    Select the values an ijson prefix refers to in an already parsed document.
+    
+    Args:
+        data: Parsed JSON document
+        prefix: ijson prefix, dot-separated keys with 'item' for array elements
+        
+    Returns:
+        The values ijson.items would yield for the prefix
+    """
+    nodes = [data]
+    for key in prefix.split('.') if prefix else []:
+        selected = []
+        for node in nodes:
+            if isinstance(node, dict):
+                if key in node:
+                    selected.append(node[key])
+            elif isinstance(node, list) and key == 'item':
+                selected.extend(node)
+        nodes = selected
+    return nodes
+
 class NusaXDatasetLoader:
     """Loader for NusaX sentiment datasets."""
     
@@ -197,50 +374,185 @@ class NusaXDatasetLoader:
             'javanese': 'https://raw.githubusercontent.com/IndoNLP/nusax/main/datasets/sentiment/javanese_sentiment.json',
             'sundanese': 'https://raw.githubusercontent.com/IndoNLP/nusax/main/datasets/sentiment/sundanese_sentiment.json'
         }
+        
+        # Shared session so downloads reuse pooled keep-alive connections to the same host
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self._session.mount('https://', adapter)
+        self._session.headers.update({'Accept-Encoding': 'gzip'})
     
-    def download_dataset(self, language: str) -> Optional[Dict]:
+    def _cache_request(self, language: str, refresh: bool = False) -> Tuple[Optional[Path], Optional[Dict]]:
         """
-        Download NusaX dataset for a specific language.
+        Decide how to bring the cached dataset for a language up to date.
         
         Args:
             language: Language name (indonesian, javanese, sundanese)
+            refresh: Download again even if a cached copy exists
             
         Returns:
-            Dataset dictionary or None if failed
+            Path to the cache file (None if the language is unsupported) and the
+            headers for the download request, or None to use the cached copy as is
         """
         if language not in self.dataset_urls:
             print(f"Language {language} not supported")
-            return None
+            return None, None
         
         cache_file = self.cache_dir / f"{language}_sentiment.json"
+        etag_file = cache_file.with_suffix('.etag')
+        headers = {}
+        if cache_file.exists() and not refresh:
+            if not etag_file.exists():
+                return cache_file, None
+            headers['If-None-Match'] = etag_file.read_text()
+        
+        if headers:
+            print(f"Checking {language} sentiment dataset for updates...")
+        else:
+            print(f"Downloading {language} sentiment dataset...")
+        return cache_file, headers
+    
+    def _store_download(self, cache_file: Path, content: bytes, etag: Optional[str]) -> Path:
+        """Cache the downloaded bytes verbatim, with the ETag for later revalidation."""
+        cache_file.write_bytes(content)
+        self._write_etag(cache_file.with_suffix('.etag'), etag)
+        
+        print(f"Dataset cached to {cache_file}")
+        return cache_file
+    
+    def _download_failed(self, language: str, cache_file: Path, headers: Dict, error: Exception) -> Optional[Path]:
+        """Keep using the cached copy if only its revalidation failed."""
+        if headers:
+            print(f"Could not revalidate {language} dataset, using cached copy: {error}")
+            return cache_file
+        print(f"Error downloading dataset for {language}: {error}")
+        return None
+    
+    def _ensure_cached(self, language: str, refresh: bool = False) -> Optional[Path]:
+        """
+        Download the NusaX dataset for a language into the cache if it is missing.
         
-        # Check if cached version exists
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading cached dataset: {e}")
+        A cached copy with a stored ETag is revalidated with a conditional GET,
+        so an unchanged remote costs a 304 response instead of a full download.
+        
+        Args:
+            language: Language name (indonesian, javanese, sundanese)
+            refresh: Download again even if a cached copy exists
+            
+        Returns:
+            Path to the cached dataset file or None if failed
+        """
+        cache_file, headers = self._cache_request(language, refresh)
+        if headers is None:
+            return cache_file
         
-        # Download dataset
         try:
-            print(f"Downloading {language} sentiment dataset...")
-            response = requests.get(self.dataset_urls[language], timeout=30)
+            response = self._session.get(self.dataset_urls[language], headers=headers, timeout=(5, 30))
+            if response.status_code == 304:
+                return cache_file
             response.raise_for_status()
+            return self._store_download(cache_file, response.content, response.headers.get('ETag'))
+        except Exception as e:
+            return self._download_failed(language, cache_file, headers, e)
+    
+    async def _ensure_cached_async(self, session: 'aiohttp.ClientSession', language: str,
+                                   refresh: bool = False) -> Optional[Path]:
+        """
+        Async counterpart of _ensure_cached over a shared aiohttp session.
+        
+        Args:
+            session: Shared client session
+            language: Language name
+            refresh: Download again even if a cached copy exists
             
-            dataset = response.json()
-            
-            # Cache the dataset
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(dataset, f, ensure_ascii=False, indent=2)
+        Returns:
+            Path to the cached dataset file or None if failed
+        """
+        cache_file, headers = self._cache_request(language, refresh)
+        if headers is None:
+            return cache_file
+        
+        try:
+            timeout = aiohttp.ClientTimeout(sock_connect=5, sock_read=30)
+            async with session.get(self.dataset_urls[language], headers=headers, timeout=timeout) as response:
+                if response.status == 304:
+                    return cache_file
+                response.raise_for_status()
+                content = await response.read()
+                etag = response.headers.get('ETag')
             
-            print(f"Dataset cached to {cache_file}")
-            return dataset
+            # Write the cache off the event loop so other downloads keep streaming
+            return await asyncio.to_thread(self._store_download, cache_file, content, etag)
+        except Exception as e:
+            return self._download_failed(language, cache_file, headers, e)
+    
+    def _write_etag(self, etag_file: Path, etag: Optional[str]) -> None:
+        """Store the ETag of a downloaded dataset, or drop a stale one."""
+        if etag:
+            etag_file.write_text(etag)
+        elif etag_file.exists():
+            etag_file.unlink()
+    
+    def _read_cache(self, cache_file: Path) -> Dict:
+        """Parse a cached dataset file."""
+        if orjson is not None:
+            return orjson.loads(cache_file.read_bytes())
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def download_dataset(self, language: str) -> Optional[Dict]:
+        """
+        Download NusaX dataset for a specific language.
+        
+        Args:
+            language: Language name (indonesian, javanese, sundanese)
             
+        Returns:
+            Dataset dictionary or None if failed
+        """
+        cache_file = self._ensure_cached(language)
+        if cache_file is None:
+            return None
+        
+        try:
+            return self._read_cache(cache_file)
+        except Exception as e:
+            print(f"Error loading cached dataset: {e}")
+        
+        # Cached copy is unreadable, so download it again
+        cache_file = self._ensure_cached(language, refresh=True)
+        if cache_file is None:
+            return None
+        
+        try:
+            return self._read_cache(cache_file)
         except Exception as e:
             print(f"Error downloading dataset for {language}: {e}")
             return None
     
+    def iter_dataset(self, language: str, prefix: str = 'item') -> Iterator[Dict]:
+        """
+        Iterate over the rows of a NusaX dataset without loading it all into memory.
+        
+        Args:
+            language: Language name (indonesian, javanese, sundanese)
+            prefix: ijson prefix of the rows, 'item' for a top-level array
+            
+        Yields:
+            Dataset rows
+        """
+        cache_file = self._ensure_cached(language)
+        if cache_file is None:
+            return
+        
+        # Without ijson, parse the whole file and follow the prefix the same way
+        if ijson is None:
+            yield from _items_at_prefix(self._read_cache(cache_file), prefix)
+            return
+        
+        with open(cache_file, 'rb') as f:
+            yield from ijson.items(f, prefix)
+    
     def load_all_datasets(self) -> Dict[str, Dict]:
         """
         Load all NusaX sentiment datasets.
@@ -248,12 +560,100 @@ class NusaXDatasetLoader:
         Returns:
             Dictionary with datasets for each language
         """
+        # Downloads are I/O-bound and write to distinct cache files, so run them concurrently
+        languages = list(self.dataset_urls.keys())
+        with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+            results = executor.map(self.download_dataset, languages)
+        
         datasets = {}
-        for language in self.dataset_urls.keys():
-            dataset = self.download_dataset(language)
+        for language, dataset in zip(languages, results):
             if dataset:
                 datasets[language] = dataset
         return datasets
+    
+    async def _fetch(self, session: 'aiohttp.ClientSession', language: str) -> Optional[Dict]:
+        """
+        Download one NusaX dataset over a shared aiohttp session.
+        
+        Args:
+            session: Shared client session
+            language: Language name
+            
+        Returns:
+            Dataset dictionary or None if failed
+        """
+        cache_file = await self._ensure_cached_async(session, language)
+        if cache_file is None:
+            return None
+        
+        try:
+            return self._read_cache(cache_file)
+        except Exception as e:
+            print(f"Error loading cached dataset: {e}")
+        
+        # Cached copy is unreadable, so download it again
+        cache_file = await self._ensure_cached_async(session, language, refresh=True)
+        if cache_file is None:
+            return None
+        
+        try:
+            return self._read_cache(cache_file)
+        except Exception as e:
+            print(f"Error downloading dataset for {language}: {e}")
+            return None
+    
+    async def download_all_async(self, max_concurrency: int = 8) -> Dict[str, Dict]:
+        """
+        Download all NusaX sentiment datasets concurrently with aiohttp.
+        
+        Falls back to load_all_datasets when aiohttp is not installed.
+        
+        Args:
+            max_concurrency: Maximum number of simultaneous connections
+            
+        Returns:
+            Dictionary with datasets for each language
+        """
+        if aiohttp is None:
+            return self.load_all_datasets()
+        
+        languages = list(self.dataset_urls.keys())
+        connector = aiohttp.TCPConnector(limit=max_concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(*(self._fetch(session, language) for language in languages))
+        
+        return {language: dataset for language, dataset in zip(languages, results) if dataset}
+    
+    def download_all(self, max_concurrency: int = 8) -> Dict[str, Dict]:
+        """
+        Synchronous wrapper around download_all_async.
+        
+        Inside a running event loop (e.g. Jupyter), await download_all_async instead.
+        
+        Args:
+            max_concurrency: Maximum number of simultaneous connections
+            
+        Returns:
+            Dictionary with datasets for each language
+        """
+        return asyncio.run(self.download_all_async(max_concurrency))
+
+def clean_and_detect(text: str, preprocessor: NusaXTextPreprocessor,
+                     detector: NusaXLanguageDetector) -> Tuple[str, Dict[str, float]]:
+    """
+    Clean text and detect its language mix, lowercasing the raw text only once.
+    
+    Args:
+        text: Raw text
+        preprocessor: Preprocessor used for cleaning
+        detector: Detector used for language scoring
+        
+    Returns:
+        Tuple of (cleaned text, dictionary with language scores)
+    """
+    text_lower = text.lower()
+    scores = dict(zip(detector.languages, _detect_scores(text_lower, detector._word_sets)))
+    return preprocessor._clean_lowered(text_lower), scores
 
 def create_mixed_language_examples():
     """Create examples of mixed-language reviews for testing."""
@@ -300,14 +700,11 @@ if __name__ == "__main__":
         text = example['text']
         print(f"\nExample {i}: {text}")
         
-        # Language detection
-        lang_scores = detector.detect_language_mix(text)
+        # Language detection and text preprocessing
+        cleaned, lang_scores = clean_and_detect(text, preprocessor, detector)
         dominant_lang = detector.get_dominant_language(text)
         print(f"Language scores: {lang_scores}")
         print(f"Dominant language: {dominant_lang}")
-        
-        # Text preprocessing
-        cleaned = preprocessor.clean_text(text)
         print(f"Cleaned text: {cleaned}")
         
         # Emoticons
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Token-bucket rate limiter for the Google Translate scripts.
+"""
+
+import threading
+import time
+
+class RateLimiter:
+    """Allow on average `rps` requests per second, with bursts of up to `rps`"""
+
+    def __init__(self, rps=5):
+        self.rps = rps
+        self.tokens = rps
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent; safe to call from worker threads"""
+
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.rps, self.tokens + (now - self.last) * self.rps)
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            # Wait exactly until the next token is available, then spend it
+            wait = (1 - self.tokens) / self.rps
+            time.sleep(wait)
+            self.tokens = 0
+            self.last = now + wait
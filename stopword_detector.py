@@ -5,18 +5,92 @@ Menganalisis kata-kata berdasarkan karakteristik umum stopword.
 """
 
 import pandas as pd
+import numpy as np
 import re
 from collections import Counter
 import nltk
 from nltk.corpus import stopwords
 import string
 
+try:
+    import pyarrow as pa
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pa = None
+    STRING_DTYPE = 'string'
+
 # Download NLTK stopwords jika belum ada
 try:
     nltk.data.find('corpora/stopwords')
 except LookupError:
     nltk.download('stopwords')
 
+# Kata yang umum dalam bahasa Indonesia
+INDONESIAN_COMMON = frozenset([
+    'yang', 'dan', 'ini', 'itu', 'untuk', 'dengan', 'dari', 'pada', 'dalam', 'oleh',
+    'akan', 'sudah', 'telah', 'sedang', 'masih', 'belum', 'tidak', 'bukan', 'jangan',
+    'ada', 'semua', 'setiap', 'beberapa', 'banyak', 'sedikit', 'lebih', 'paling',
+    'sangat', 'hanya', 'juga', 'lagi', 'selalu', 'sering', 'kadang', 'pernah'
+])
+
+# Akhiran partikel yang umum pada stopword
+STOPWORD_SUFFIXES = ('nya', 'lah', 'kah', 'tah', 'pun')
+
+# Daftar kata Indonesia yang umum sebagai stopword
+INDONESIAN_STOPWORDS = frozenset({
+    'yang', 'dan', 'ini', 'itu', 'untuk', 'dengan', 'dari', 'pada', 'dalam', 'oleh',
+    'akan', 'sudah', 'telah', 'sedang', 'masih', 'belum', 'tidak', 'bukan', 'jangan',
+    'ada', 'semua', 'setiap', 'beberapa', 'banyak', 'sedikit', 'lebih', 'paling',
+    'sangat', 'hanya', 'juga', 'lagi', 'selalu', 'sering', 'kadang', 'pernah',
+    'aku', 'kamu', 'dia', 'kita', 'mereka', 'saya', 'anda', 'kalian',
+    'dimana', 'kemana', 'darimana', 'bagaimana', 'mengapa', 'kenapa', 'kapan', 'siapa',
+    'apa', 'mana', 'bila', 'jika', 'kalau', 'ketika', 'saat', 'waktu',
+    'karena', 'sebab', 'akibat', 'hingga', 'sampai', 'setelah', 'sesudah', 'sebelum',
+    'antara', 'diantara', 'sekitar', 'dekat', 'jauh', 'atas', 'bawah', 'depan', 'belakang',
+    'kiri', 'kanan', 'tengah', 'luar', 'dalam', 'luas', 'sempit',
+    'besar', 'kecil', 'panjang', 'pendek', 'tinggi', 'rendah', 'tebal', 'tipis',
+    'berat', 'ringan', 'keras', 'lunak', 'kasar', 'halus', 'panas', 'dingin',
+    'hangat', 'sejuk', 'basah', 'kering', 'bersih', 'kotor', 'baru', 'lama',
+    'muda', 'tua', 'cepat', 'lambat', 'mudah', 'sulit', 'gampang', 'susah',
+    'baik', 'buruk', 'bagus', 'jelek', 'cantik', 'indah', 'senang', 'sedih',
+    'marah', 'takut', 'berani', 'sayang', 'cinta', 'benci'
+})
+
+# Kata-kata slang dan informal yang umum
+SLANG_WORDS = frozenset({
+    'gw', 'gue', 'lu', 'lo', 'elu', 'w', 'u', 'km', 'sy', 'dy', 'mrk', 'kt', 'kmi',
+    'yg', 'dgn', 'dr', 'utk', 'pd', 'dlm', 'olh', 'akn', 'sdh', 'sdg', 'msh', 'blm',
+    'tdk', 'bkn', 'jgn', 'smu', 'bnyk', 'sdkt', 'sgt', 'hny', 'jg', 'lg', 'sll',
+    'skrg', 'ntr', 'kmrn', 'bsk', 'hr', 'gmn', 'bgmn', 'dmn', 'kmn', 'drmn',
+    'spa', 'sapa', 'ap', 'apa', 'mn', 'kpn', 'knp', 'krn', 'jk', 'ktk', 'saat',
+    'wkt', 'di', 'ke', 'dari', 'untuk', 'dengan', 'pada', 'dalam', 'oleh',
+    'udah', 'udeh', 'belom', 'blom', 'gitu', 'gini', 'banget', 'bgt', 'kayak', 'kaya',
+    'kok', 'sih', 'deh', 'dong', 'lah', 'kah', 'tuh', 'nih', 'yah', 'wah', 'nah',
+    'kan', 'ya', 'iya', 'yup', 'yep', 'oke', 'ok', 'okay'
+})
+
+# Partikel dan kata sambung
+PARTICLES = frozenset({
+    'nya', 'mu', 'ku', 'pun', 'lah', 'kah', 'tah', 'deh', 'dong', 'sih', 'kok',
+    'yah', 'wah', 'nah', 'kan', 'tuh', 'nih'
+})
+
+# Interjeksi dan ekspresi
+INTERJECTIONS = frozenset({
+    'oh', 'ah', 'eh', 'uh', 'um', 'hmm', 'hm', 'em', 'ih', 'aduh', 'astaga',
+    'alamak', 'waduh', 'duh', 'owh', 'owwh', 'owwwh', 'oooh', 'aaah', 'eeeh',
+    'iiih', 'uuuh', 'haah', 'haaah', 'huft', 'hufh', 'hufft'
+})
+
+# Singkatan umum dan variasi tawa
+COMMON_ABBREVIATIONS = frozenset([
+    'brb', 'btw', 'cmiiw', 'fyi', 'imho', 'lol', 'omg', 'wtf', 'asap', 'aka', 'etc', 'lmao', 'rofl', 'ttyl', 'imo', 'tbh', 'nvm', 'idk', 'irl', 'dm', 'pm',
+    'haha', 'hahaha', 'hahahaha', 'hehe', 'hehehe', 'hihi', 'hoho', 'huhu', 'wakaka', 'wakakaka', 'kwkw', 'kwkwkw', 'kkkk', 'kkkkk', 'wkwk', 'wkwkwk', 'wkwkwkwk', 'xixixi', 'xixi'
+])
+
+# Satu karakter tanda baca apa pun
+PUNCTUATION_PATTERN = re.compile(f'[{re.escape(string.punctuation)}]')
+
 class StopwordDetector:
     def __init__(self, csv_file):
         self.csv_file = csv_file
@@ -73,21 +147,33 @@ class StopwordDetector:
             'slang_informal': ['lol', 'omg', 'wtf', 'btw', 'fyi', 'asap', 'aka', 'etc', 'lmao', 'rofl',
                              'wkwk', 'haha', 'hehe', 'hihi', 'gw', 'gue', 'lu', 'lo', 'bro', 'sis']
         }
+        
+        # Pattern stopword dalam bentuk set huruf kecil, dihitung sekali
+        self.pattern_sets = {name: frozenset(w.lower() for w in words)
+                             for name, words in self.common_stopword_patterns.items()}
+        self.all_pattern_words = frozenset().union(*self.pattern_sets.values())
+        
+        # Semua kata yang dikenal sebagai stopword, dikumpulkan sekali
+        self._known_stopwords = (self.english_stopwords | self.all_pattern_words | INDONESIAN_STOPWORDS |
+                                 SLANG_WORDS | PARTICLES | INTERJECTIONS | COMMON_ABBREVIATIONS)
     
     def load_data(self):
         """Load CSV file dan ekstrak semua kata"""
         try:
-            self.df = pd.read_csv(self.csv_file)
+            # String Arrow-backed lebih hemat memori jika pyarrow tersedia
+            if pa is not None:
+                self.df = pd.read_csv(self.csv_file, engine='pyarrow', dtype_backend='pyarrow')
+            else:
+                self.df = pd.read_csv(self.csv_file)
             print(f"✓ File berhasil dimuat: {len(self.df)} baris")
             print(f"✓ Kolom: {list(self.df.columns)}")
             
-            # Ekstrak semua kata dari semua kolom
-            for column in self.df.columns:
-                words = self.df[column].dropna().astype(str).tolist()
-                self.all_words.extend([word.strip().lower() for word in words if word.strip() and word.strip() != 'nan'])
-            
-            # Hapus duplikat dan kata kosong
-            self.all_words = list(set([word for word in self.all_words if word and len(word) > 0]))
+            # Ekstrak semua kata dari semua kolom sekaligus, lalu hapus duplikat dan kata kosong
+            words = pd.concat([self.df[column] for column in self.df.columns], ignore_index=True)
+            # Tetap sebagai string dtype agar strip/lower berjalan vektor, tanpa konversi ke object
+            words = words.dropna().astype(STRING_DTYPE).str.strip().str.lower()
+            words = words[(words != '') & (words != 'nan')]
+            self.all_words = words.unique().tolist()
             print(f"✓ Total kata unik: {len(self.all_words)}")
             
         except Exception as e:
@@ -106,52 +192,51 @@ class StopwordDetector:
             'suspicious_words': []
         }
         
-        # Statistik panjang kata
-        word_lengths = [len(word) for word in self.all_words]
-        results['word_length_stats'] = {
-            'min': min(word_lengths),
-            'max': max(word_lengths),
-            'avg': sum(word_lengths) / len(word_lengths),
-            'distribution': Counter(word_lengths)
-        }
+        words_set = set(self.all_words)
         
         # Cek kecocokan dengan pattern stopword
-        for pattern_name, pattern_words in self.common_stopword_patterns.items():
-            matches = [word for word in self.all_words if word in [p.lower() for p in pattern_words]]
+        for pattern_name, pattern_set in self.pattern_sets.items():
+            matches = list(words_set & pattern_set)
             results['pattern_matches'][pattern_name] = {
                 'count': len(matches),
                 'words': matches[:10]  # Tampilkan 10 contoh
             }
         
-        # Cek kecocokan dengan NLTK English stopwords
-        nltk_matches = [word for word in self.all_words if word in self.english_stopwords]
-        results['nltk_stopword_matches'] = len(nltk_matches)
-        
-        # Identifikasi kata yang mungkin bukan stopword
-        all_pattern_words = set()
-        for pattern_words in self.common_stopword_patterns.values():
-            all_pattern_words.update([p.lower() for p in pattern_words])
+        # Panjang kata dan kata mencurigakan dihitung vektor dengan NumPy
+        words_array = np.array(self.all_words, dtype=str)
+        word_lengths = np.char.str_len(words_array)
+        suspicious_mask = ((word_lengths > 6) |  # Kata panjang
+                           np.char.isdigit(words_array) |  # Angka
+                           np.array([PUNCTUATION_PATTERN.search(word) is not None for word in self.all_words], dtype=bool) |  # Mengandung tanda baca
+                           np.char.isupper(words_array))  # Semua huruf kapital
         
+        # Satu kali lewat semua kata: kecocokan NLTK dan kandidat bukan stopword
+        nltk_match_count = 0
         potential_non_stopwords = []
         for word in self.all_words:
-            if (word not in self.english_stopwords and 
-                word not in all_pattern_words and
+            # Cek kecocokan dengan NLTK English stopwords
+            is_nltk_stopword = word in self.english_stopwords
+            if is_nltk_stopword:
+                nltk_match_count += 1
+            
+            # Identifikasi kata yang mungkin bukan stopword
+            if (not is_nltk_stopword and
+                word not in self.all_pattern_words and
                 len(word) > 3 and
                 not self.is_likely_stopword(word)):
                 potential_non_stopwords.append(word)
         
+        # Statistik panjang kata
+        lengths, counts = np.unique(word_lengths, return_counts=True)
+        results['word_length_stats'] = {
+            'min': int(word_lengths.min()),
+            'max': int(word_lengths.max()),
+            'avg': float(word_lengths.mean()),
+            'distribution': Counter(dict(zip(lengths.tolist(), counts.tolist())))
+        }
+        results['nltk_stopword_matches'] = nltk_match_count
         results['non_stopword_candidates'] = potential_non_stopwords[:20]  # Top 20
-        
-        # Identifikasi kata yang mencurigakan (mungkin bukan stopword)
-        suspicious = []
-        for word in self.all_words:
-            if (len(word) > 6 or  # Kata panjang
-                word.isdigit() or  # Angka
-                any(char in string.punctuation for char in word) or  # Mengandung tanda baca
-                word.isupper()):  # Semua huruf kapital
-                suspicious.append(word)
-        
-        results['suspicious_words'] = suspicious[:20]
+        results['suspicious_words'] = words_array[suspicious_mask][:20].tolist()
         
         self.analysis_results = results
         return results
@@ -163,120 +248,20 @@ class StopwordDetector:
             return True
         
         # Kata yang umum dalam bahasa Indonesia
-        indonesian_common = ['yang', 'dan', 'ini', 'itu', 'untuk', 'dengan', 'dari', 'pada', 'dalam', 'oleh',
-                           'akan', 'sudah', 'telah', 'sedang', 'masih', 'belum', 'tidak', 'bukan', 'jangan',
-                           'ada', 'semua', 'setiap', 'beberapa', 'banyak', 'sedikit', 'lebih', 'paling',
-                           'sangat', 'hanya', 'juga', 'lagi', 'selalu', 'sering', 'kadang', 'pernah']
-        
-        if word in indonesian_common:
+        if word in INDONESIAN_COMMON:
             return True
         
         # Kata yang berakhiran umum stopword
-        stopword_suffixes = ['nya', 'lah', 'kah', 'tah', 'pun']
-        if any(word.endswith(suffix) for suffix in stopword_suffixes):
-            return True
-        
-        return False
+        return word.endswith(STOPWORD_SUFFIXES)
     
     def identify_non_stopwords(self):
         """Identifikasi kata-kata yang kemungkinan bukan stopword dengan kriteria yang lebih ketat"""
-        non_stopwords = []
-
-        # Kumpulkan semua kata yang dikenal sebagai stopword
-        all_known_stopwords = set()
-
-        # Tambahkan NLTK English stopwords
-        all_known_stopwords.update(self.english_stopwords)
-
-        # Tambahkan pattern stopwords
-        for pattern_words in self.common_stopword_patterns.values():
-            all_known_stopwords.update([p.lower() for p in pattern_words])
-
-        # Daftar kata Indonesia yang umum sebagai stopword
-        indonesian_stopwords = {
-            'yang', 'dan', 'ini', 'itu', 'untuk', 'dengan', 'dari', 'pada', 'dalam', 'oleh',
-            'akan', 'sudah', 'telah', 'sedang', 'masih', 'belum', 'tidak', 'bukan', 'jangan',
-            'ada', 'semua', 'setiap', 'beberapa', 'banyak', 'sedikit', 'lebih', 'paling',
-            'sangat', 'hanya', 'juga', 'lagi', 'selalu', 'sering', 'kadang', 'pernah',
-            'aku', 'kamu', 'dia', 'kita', 'mereka', 'saya', 'anda', 'kalian',
-            'dimana', 'kemana', 'darimana', 'bagaimana', 'mengapa', 'kenapa', 'kapan', 'siapa',
-            'apa', 'mana', 'bila', 'jika', 'kalau', 'ketika', 'saat', 'waktu',
-            'karena', 'sebab', 'akibat', 'hingga', 'sampai', 'setelah', 'sesudah', 'sebelum',
-            'antara', 'diantara', 'sekitar', 'dekat', 'jauh', 'atas', 'bawah', 'depan', 'belakang',
-            'kiri', 'kanan', 'tengah', 'luar', 'dalam', 'luas', 'sempit',
-            'besar', 'kecil', 'panjang', 'pendek', 'tinggi', 'rendah', 'tebal', 'tipis',
-            'berat', 'ringan', 'keras', 'lunak', 'kasar', 'halus', 'panas', 'dingin',
-            'hangat', 'sejuk', 'basah', 'kering', 'bersih', 'kotor', 'baru', 'lama',
-            'muda', 'tua', 'cepat', 'lambat', 'mudah', 'sulit', 'gampang', 'susah',
-            'baik', 'buruk', 'bagus', 'jelek', 'cantik', 'indah', 'senang', 'sedih',
-            'marah', 'takut', 'berani', 'sayang', 'cinta', 'benci'
-        }
-        all_known_stopwords.update(indonesian_stopwords)
-
-        # Kata-kata slang dan informal yang umum
-        slang_words = {
-            'gw', 'gue', 'lu', 'lo', 'elu', 'w', 'u', 'km', 'sy', 'dy', 'mrk', 'kt', 'kmi',
-            'yg', 'dgn', 'dr', 'utk', 'pd', 'dlm', 'olh', 'akn', 'sdh', 'sdg', 'msh', 'blm',
-            'tdk', 'bkn', 'jgn', 'smu', 'bnyk', 'sdkt', 'sgt', 'hny', 'jg', 'lg', 'sll',
-            'skrg', 'ntr', 'kmrn', 'bsk', 'hr', 'gmn', 'bgmn', 'dmn', 'kmn', 'drmn',
-            'spa', 'sapa', 'ap', 'apa', 'mn', 'kpn', 'knp', 'krn', 'jk', 'ktk', 'saat',
-            'wkt', 'di', 'ke', 'dari', 'untuk', 'dengan', 'pada', 'dalam', 'oleh',
-            'udah', 'udeh', 'belom', 'blom', 'gitu', 'gini', 'banget', 'bgt', 'kayak', 'kaya',
-            'kok', 'sih', 'deh', 'dong', 'lah', 'kah', 'tuh', 'nih', 'yah', 'wah', 'nah',
-            'kan', 'ya', 'iya', 'yup', 'yep', 'oke', 'ok', 'okay'
-        }
-        all_known_stopwords.update(slang_words)
-
-        # Partikel dan kata sambung
-        particles = {
-            'nya', 'mu', 'ku', 'pun', 'lah', 'kah', 'tah', 'deh', 'dong', 'sih', 'kok',
-            'yah', 'wah', 'nah', 'kan', 'tuh', 'nih'
-        }
-        all_known_stopwords.update(particles)
-
-        # Interjeksi dan ekspresi
-        interjections = {
-            'oh', 'ah', 'eh', 'uh', 'um', 'hmm', 'hm', 'em', 'ih', 'aduh', 'astaga',
-            'alamak', 'waduh', 'duh', 'owh', 'owwh', 'owwwh', 'oooh', 'aaah', 'eeeh',
-            'iiih', 'uuuh', 'haah', 'haaah', 'huft', 'hufh', 'hufft'
-        }
-        all_known_stopwords.update(interjections)
-
-        # Cek setiap kata
-        for word in self.all_words:
-            is_stopword = False
+        # Skip kata kosong; kata di self.all_words sudah huruf kecil
+        # Kata yang tidak dikenal dan tidak berakhiran partikel (termasuk angka) masuk daftar non-stopword
+        non_stopwords = {word for word in self.all_words
+                         if word and word not in self._known_stopwords and not word.endswith(STOPWORD_SUFFIXES)}
 
-            # Skip jika kata kosong atau terlalu pendek
-            if not word or len(word) < 1:
-                continue
-
-            # Cek apakah kata ada dalam daftar stopword yang dikenal
-            if word.lower() in all_known_stopwords:
-                is_stopword = True
-
-            # Cek apakah kata berakhiran partikel
-            elif any(word.endswith(suffix) for suffix in ['nya', 'lah', 'kah', 'tah', 'pun']):
-                is_stopword = True
-
-            # Cek apakah kata adalah singkatan umum
-            elif word in ['brb', 'btw', 'cmiiw', 'fyi', 'imho', 'lol', 'omg', 'wtf', 'asap', 'aka', 'etc', 'lmao', 'rofl', 'ttyl', 'imo', 'tbh', 'nvm', 'idk', 'irl', 'dm', 'pm']:
-                is_stopword = True
-
-            # Cek apakah kata adalah variasi tawa
-            elif word in ['haha', 'hahaha', 'hahahaha', 'hehe', 'hehehe', 'hihi', 'hoho', 'huhu', 'wakaka', 'wakakaka', 'kwkw', 'kwkwkw', 'kkkk', 'kkkkk', 'wkwk', 'wkwkwk', 'wkwkwkwk', 'xixixi', 'xixi']:
-                is_stopword = True
-
-            # Cek apakah kata adalah angka atau mengandung angka
-            elif word.isdigit() or any(char.isdigit() for char in word):
-                # Kecuali jika itu nama tempat atau hal spesifik
-                if word not in ['b2', 'b3', 'ms', 'th', 't4', 'gr2', 'pa2', 'kt2', 'sm2']:
-                    is_stopword = False  # Angka biasanya bukan stopword
-
-            # Jika tidak memenuhi kriteria stopword, tambahkan ke daftar non-stopword
-            if not is_stopword:
-                non_stopwords.append(word)
-
-        return sorted(list(set(non_stopwords)))
+        return sorted(non_stopwords)
 
     def separate_non_stopwords(self, output_file='non_stopwords.csv'):
         """Pisahkan kata-kata yang bukan stopword ke file CSV terpisah"""
@@ -286,33 +271,27 @@ class StopwordDetector:
             print("✅ Semua kata teridentifikasi sebagai stopword!")
             return
 
-        # Buat DataFrame untuk kata-kata yang bukan stopword
-        non_stopword_rows = []
-
-        # Cari baris yang mengandung kata-kata non-stopword
-        for idx, row in self.df.iterrows():
-            contains_non_stopword = False
-            for col in self.df.columns:
-                if pd.notna(row[col]) and str(row[col]).strip().lower() in [w.lower() for w in non_stopwords]:
-                    contains_non_stopword = True
-                    break
-
-            if contains_non_stopword:
-                non_stopword_rows.append(row)
+        # Tandai baris yang mengandung kata non-stopword, satu kolom sekaligus
+        non_stopword_set = set(w.lower() for w in non_stopwords)
+        mask = np.zeros(len(self.df), dtype=bool)
+        for col in self.df.columns:
+            values = self.df[col]
+            mask |= (values.notna() & values.astype(str).str.strip().str.lower().isin(non_stopword_set)).to_numpy()
+        moved_rows = int(mask.sum())
 
-        if non_stopword_rows:
+        if moved_rows:
             # Simpan ke file CSV
-            non_stopword_df = pd.DataFrame(non_stopword_rows)
+            non_stopword_df = self.df[mask]
             non_stopword_df.to_csv(output_file, index=False)
-            print(f"✅ {len(non_stopword_rows)} baris dengan kata non-stopword disimpan ke: {output_file}")
+            print(f"✅ {moved_rows} baris dengan kata non-stopword disimpan ke: {output_file}")
 
             # Hapus baris non-stopword dari file asli
-            clean_df = self.df.drop(non_stopword_df.index)
+            clean_df = self.df[~mask]
             clean_file = self.csv_file.replace('.csv', '_cleaned.csv')
             clean_df.to_csv(clean_file, index=False)
             print(f"✅ File bersih (hanya stopword) disimpan ke: {clean_file}")
 
-            return non_stopwords, len(non_stopword_rows)
+            return non_stopwords, moved_rows
         else:
             print("✅ Tidak ada baris yang mengandung kata non-stopword")
             return non_stopwords, 0
@@ -5,6 +5,7 @@ Simple test script to verify Google Translate functionality
 
 import pandas as pd
 from googletrans import Translator
+from translation_utils import needs_translation_mask
 import time
 
 def test_translation():
@@ -38,24 +39,24 @@ def translate_sample_dataset():
     # Load dataset
     df = pd.read_csv('multilingual_stopwords_final.csv')
     
-    # Find entries missing English
-    missing_en = (df['en'].isna() | (df['en'] == ''))
-    has_indonesian = (df['id'].notna() & (df['id'] != '')) | (df['formal_id'].notna() & (df['formal_id'] != ''))
-    
-    # Get first 10 entries that need translation
-    sample_entries = df[missing_en & has_indonesian].head(10)
+    # Get first 10 entries missing English that have Indonesian text
+    sample_entries = df[needs_translation_mask(df)].head(10)
     
     print(f"Found {len(sample_entries)} sample entries to translate:")
     
     # Initialize translator
     translator = Translator()
     
-    for i, (idx, row) in enumerate(sample_entries.iterrows()):
+    # Read the columns once instead of building a Series per row
+    formals = sample_entries['formal_id'].to_numpy()
+    ids = sample_entries['id'].to_numpy()
+    
+    for i in range(len(formals)):
         # Get Indonesian text to translate
-        if pd.notna(row['formal_id']) and str(row['formal_id']).strip():
-            indonesian_text = str(row['formal_id']).strip()
-        elif pd.notna(row['id']) and str(row['id']).strip():
-            indonesian_text = str(row['id']).strip()
+        if pd.notna(formals[i]) and str(formals[i]).strip():
+            indonesian_text = str(formals[i]).strip()
+        elif pd.notna(ids[i]) and str(ids[i]).strip():
+            indonesian_text = str(ids[i]).strip()
         else:
             continue
         
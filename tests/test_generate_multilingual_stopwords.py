@@ -0,0 +1,51 @@
+from generate_multilingual_stopwords import COLUMNS, MultilingualStopwordGenerator
+
+
+def make_generator(entries):
+    # Skip __init__, which sets up NLTK and the language mappings
+    generator = MultilingualStopwordGenerator.__new__(MultilingualStopwordGenerator)
+    generator.stopwords_data = {col: [] for col in COLUMNS}
+    generator.add_stopword_entries(entries)
+    return generator
+
+
+def rows(generator):
+    return list(zip(*(generator.stopwords_data[col] for col in COLUMNS)))
+
+
+def test_deduplicate_keeps_same_word_in_different_columns():
+    generator = make_generator([
+        ('', '', '', 'di', 'di'),
+        ('', 'di', '', '', 'di'),
+        ('', '', 'banget', '', 'sangat'),
+        ('', 'banget', '', '', 'sangat'),
+        ('', 'di', '', '', 'di'),
+        ('', '', '', '', ''),
+    ])
+
+    generator.deduplicate_entries()
+
+    assert rows(generator) == [
+        ('', '', '', 'di', 'di'),
+        ('', 'di', '', '', 'di'),
+        ('', '', 'banget', '', 'sangat'),
+        ('', 'banget', '', '', 'sangat'),
+    ]
+
+
+def test_save_to_csv_matches_baseline_format(tmp_path):
+    generator = make_generator([
+        ('', 'yang', 'sing', 'nu', 'yang'),
+        ('a', '', '', '', ''),
+        ('i, me', 'saya', 'aku', 'abdi', 'saya'),
+    ])
+    filename = tmp_path / 'stopwords.csv'
+
+    generator.save_to_csv(str(filename))
+
+    assert filename.read_bytes() == (
+        b'en,id,jv,su,formal_id\n'
+        b',yang,sing,nu,yang\n'
+        b'a,,,,\n'
+        b'"i, me",saya,aku,abdi,saya\n'
+    )
@@ -4,46 +4,65 @@ Conservative translation script with better rate limiting and error handling
 """
 
 import pandas as pd
+import re
 import time
+import asyncio
 import logging
 from googletrans import Translator
+from translation_utils import non_empty, needs_translation_mask, is_valid_translation
+from rate_limiter import RateLimiter
+from cache import text_hash, get_cached, put_many, mark_untranslatable, known_untranslatable
 import sys
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def translate_with_retry(translator, text, max_retries=3):
-    """Translate with retry logic"""
+# Common English words; texts containing them are already English
+ENGLISH_HINT_PATTERN = re.compile(r'\b(?:the|and|for|with|you|are)\b')
+
+def should_skip(text):
+    """Check whether text is too long or looks like English, without a network call"""
+    
+    return len(text) > 30 or ENGLISH_HINT_PATTERN.search(text.lower()) is not None
+
+def translate_with_retry(translator, text, limiter, max_retries=3):
+    """Translate with retry logic; None if every attempt failed, '' if the translation looks wrong"""
     
     for attempt in range(max_retries):
         try:
+            # Every attempt is a request, so each one waits for a token
+            limiter.acquire()
             result = translator.translate(text.strip(), src='id', dest='en')
             translation = result.text.lower().strip()
-            
-            # Basic validation
-            if len(translation) > 50:  # Too long, likely error
-                return ''
-            elif translation == text.lower():  # Translation failed
-                return ''
-            
-            return translation
+            return translation if is_valid_translation(text, translation) else ''
             
         except Exception as e:
             logging.warning(f"Attempt {attempt + 1} failed for '{text}': {e}")
             if attempt < max_retries - 1:
                 time.sleep(2 ** attempt)  # Exponential backoff
-            else:
-                return ''
     
-    return ''
+    return None
+
+async def translate_concurrently(translator, texts, concurrency=8, rps=5):
+    """Translate texts concurrently, at most `concurrency` requests in flight and `rps` per second"""
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    # Requests are paced by a token bucket shared by all worker threads
+    limiter = RateLimiter(rps)
+    
+    async def translate_one(text):
+        async with semaphore:
+            # googletrans is synchronous, so each request runs in a worker thread
+            return await asyncio.to_thread(translate_with_retry, translator, text, limiter)
+    
+    # One request per text, so a failure retries and blanks only that text
+    return await asyncio.gather(*(translate_one(text) for text in texts))
 
-def translate_batch_conservative(df, start_idx=0, batch_size=100):
-    """Translate a batch of entries conservatively"""
+async def translate_batch_conservative(df, start_idx=0, batch_size=100, concurrency=8):
+    """Translate a batch of entries conservatively, updating df in place"""
     
     # Get entries that need translation
-    missing_en = (df['en'].isna() | (df['en'] == ''))
-    has_indonesian = (df['id'].notna() & (df['id'] != '')) | (df['formal_id'].notna() & (df['formal_id'] != ''))
-    candidates = df[missing_en & has_indonesian].copy()
+    candidates = df[needs_translation_mask(df)]
     
     if len(candidates) == 0:
         print("No entries need translation")
@@ -58,40 +77,66 @@ def translate_batch_conservative(df, start_idx=0, batch_size=100):
     # Initialize translator
     translator = Translator()
     
-    # Process each entry
-    df_updated = df.copy()
-    translated_count = 0
+    # Process each entry; translations are written back to df in one assignment
+    updates = {}
+    
+    jobs = []
+    # Read the columns once instead of building a Series per row
+    idxs = batch_candidates.index.to_numpy()
+    formals = batch_candidates['formal_id'].to_numpy()
+    ids = batch_candidates['id'].to_numpy()
     
-    for i, (idx, row) in enumerate(batch_candidates.iterrows()):
+    for i in range(len(formals)):
         # Get text to translate
-        if pd.notna(row['formal_id']) and str(row['formal_id']).strip():
-            text = str(row['formal_id']).strip()
-        elif pd.notna(row['id']) and str(row['id']).strip():
-            text = str(row['id']).strip()
+        if pd.notna(formals[i]) and str(formals[i]).strip():
+            text = str(formals[i]).strip()
+        elif pd.notna(ids[i]) and str(ids[i]).strip():
+            text = str(ids[i]).strip()
         else:
             continue
         
         # Skip if text is too long or looks like English
-        if len(text) > 30 or any(word in text.lower() for word in ['the', 'and', 'for', 'with', 'you', 'are']):
+        if should_skip(text):
             continue
         
-        print(f"  {i + 1:3d}/{len(batch_candidates)}: Translating '{text}'...", end=' ')
-        
-        # Translate
-        translation = translate_with_retry(translator, text)
+        jobs.append((i, idxs[i], text))
+    
+    # Translate each unique text once, skipping texts cached by earlier runs
+    cache = {}
+    pending = []
+    for text in dict.fromkeys(text for _, _, text in jobs):
+        cached = get_cached(text_hash(text))
+        if cached is not None:
+            cache[text] = cached
+        else:
+            pending.append(text)
+    
+    # Texts Google recently failed to translate are not retried yet
+    skipped = known_untranslatable([text_hash(text) for text in pending])
+    pending = [text for text in pending if text_hash(text) not in skipped]
+    if pending:
+        # Translate all texts concurrently, overlapping the network round trips
+        translations = await translate_concurrently(translator, pending, concurrency)
+        cache.update((text, translation) for text, translation in zip(pending, translations) if translation)
         
+        # Persist the results; translations that failed validation go to the negative cache
+        put_many([(text_hash(text), translation) for text, translation in zip(pending, translations) if translation])
+        mark_untranslatable([text_hash(text) for text, translation in zip(pending, translations) if translation == ''])
+    
+    for i, idx, text in jobs:
+        translation = cache.get(text, '')
         if translation:
-            df_updated.at[idx, 'en'] = translation
-            translated_count += 1
-            print(f"-> '{translation}'")
+            updates[idx] = translation
+            print(f"  {i + 1:3d}/{len(batch_candidates)}: '{text}' -> '{translation}'")
         else:
-            print("-> FAILED")
-        
-        # Rate limiting - wait between each translation
-        time.sleep(1)
+            print(f"  {i + 1:3d}/{len(batch_candidates)}: '{text}' -> FAILED")
     
+    if updates:
+        df.loc[list(updates.keys()), 'en'] = list(updates.values())
+    
+    translated_count = len(updates)
     print(f"\nBatch complete: {translated_count} translations successful")
-    return df_updated, translated_count
+    return df, translated_count
 
 def main():
     """Main function"""
@@ -123,22 +168,23 @@ def main():
         return
     
     # Check how many need translation
-    missing_en = (df['en'].isna() | (df['en'] == ''))
-    has_indonesian = (df['id'].notna() & (df['id'] != '')) | (df['formal_id'].notna() & (df['formal_id'] != ''))
-    total_needing_translation = (missing_en & has_indonesian).sum()
+    total_needing_translation = needs_translation_mask(df).sum()
     
     print(f"Total entries needing translation: {total_needing_translation}")
     
+    # Count before translating, since the batch updates df in place
+    original_en = non_empty(df['en']).sum()
+    
     # Process batch
-    df_translated, count = translate_batch_conservative(df, start_idx, batch_size)
+    # Start the event loop once here; async code awaits translate_batch_conservative instead
+    df_translated, count = asyncio.run(translate_batch_conservative(df, start_idx, batch_size))
     
     # Save results
     output_file = f'multilingual_stopwords_batch_{start_idx}_{start_idx + batch_size}.csv'
     df_translated.to_csv(output_file, index=False)
     
     # Show summary
-    original_en = (df['en'].notna() & (df['en'] != '')).sum()
-    final_en = (df_translated['en'].notna() & (df_translated['en'] != '')).sum()
+    final_en = non_empty(df_translated['en']).sum()
     
     print(f"\n=== TRANSLATION SUMMARY ===")
     print(f"Original English entries: {original_en}")
@@ -4,17 +4,24 @@ Script to fill empty English columns by translating from Indonesian columns usin
 """
 
 import pandas as pd
-import time
+import asyncio
 import logging
 from googletrans import Translator
+from cache import text_hash, get_cached, put_many, mark_untranslatable, known_untranslatable
+from rate_limiter import RateLimiter
+from dict_translate import INDONESIAN_ENGLISH_DICT
+from translation_utils import non_empty, needs_translation_mask, source_text, is_valid_translation
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Text columns are read as strings so numeric-looking words are not inferred as numbers
+TEXT_DTYPES = {'en': str, 'id': str, 'jv': str, 'su': str, 'formal_id': str}
+
 def load_stopwords_dataset():
     """Load the multilingual stopwords dataset"""
     try:
-        df = pd.read_csv('multilingual_stopwords_final.csv')
+        df = pd.read_csv('multilingual_stopwords_final.csv', dtype=TEXT_DTYPES)
         logging.info(f"Loaded dataset with {len(df)} entries")
         return df
     except FileNotFoundError:
@@ -25,12 +32,10 @@ def analyze_missing_english(df):
     """Analyze which entries are missing English translations"""
     
     # Count missing English entries
-    missing_en = df['en'].isna() | (df['en'] == '')
-    total_missing = missing_en.sum()
+    total_missing = (~non_empty(df['en'])).sum()
     
     # Count entries that have Indonesian but no English
-    has_indonesian = (df['id'].notna() & (df['id'] != '')) | (df['formal_id'].notna() & (df['formal_id'] != ''))
-    missing_en_with_id = missing_en & has_indonesian
+    missing_en_with_id = needs_translation_mask(df)
     translatable_count = missing_en_with_id.sum()
     
     logging.info(f"Total entries missing English: {total_missing}")
@@ -38,53 +43,83 @@ def analyze_missing_english(df):
     
     return missing_en_with_id
 
-def translate_batch(texts, translator, source_lang='id', target_lang='en', batch_size=50):
-    """Translate a batch of texts with rate limiting"""
+def translate_text(translator, text, source_lang='id', target_lang='en', limiter=None):
+    """Translate a single text, returning '' on failure"""
+    
+    try:
+        if limiter:
+            limiter.acquire()
+        result = translator.translate(text, src=source_lang, dest=target_lang)
+        return result.text.lower().strip()
+    except Exception as e:
+        logging.warning(f"Translation failed for '{text}': {e}")
+        return ''
+
+async def translate_concurrently(translator, texts, source_lang='id', target_lang='en', concurrency=8, limiter=None):
+    """Translate texts concurrently, at most `concurrency` requests in flight"""
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def translate_one(text):
+        async with semaphore:
+            # googletrans is synchronous, so each request runs in a worker thread
+            return await asyncio.to_thread(translate_text, translator, text, source_lang, target_lang, limiter)
+    
+    return await asyncio.gather(*(translate_one(text) for text in texts))
+
+async def translate_batch(texts, translator, source_lang='id', target_lang='en', batch_size=50, cache=None, concurrency=8, rps=5):
+    """Translate a batch of texts with rate limiting, calling the API once per unique text"""
+    
+    if cache is None:
+        cache = {}
     
-    translations = []
+    # Repeated tokens share one normalized key; texts translated by earlier runs come from disk
+    keys = [str(text).strip().lower() if text else '' for text in texts]
+    pending = {}
+    for text, key in zip(texts, keys):
+        if key and key != 'nan' and key not in cache and key not in pending:
+            cached = get_cached(text_hash(key), target_lang)
+            if cached is not None:
+                cache[key] = cached
+            else:
+                pending[key] = str(text).strip()
     
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i:i+batch_size]
-        batch_translations = []
+    # Texts Google recently failed to translate are not retried yet
+    skipped = known_untranslatable([text_hash(key) for key in pending], target_lang)
+    pending = [(key, text) for key, text in pending.items() if text_hash(key) not in skipped]
+    
+    # Requests are paced by a token bucket shared by all worker threads
+    limiter = RateLimiter(rps)
+    
+    for i in range(0, len(pending), batch_size):
+        batch = pending[i:i+batch_size]
         
-        for text in batch:
-            try:
-                if text and str(text).strip() and str(text).strip().lower() != 'nan':
-                    # Translate the text
-                    result = translator.translate(str(text).strip(), src=source_lang, dest=target_lang)
-                    translation = result.text.lower().strip()
-                    batch_translations.append(translation)
-                    
-                    # Small delay to avoid rate limiting
-                    time.sleep(0.1)
-                else:
-                    batch_translations.append('')
-                    
-            except Exception as e:
-                logging.warning(f"Translation failed for '{text}': {e}")
-                batch_translations.append('')
-                time.sleep(0.5)  # Longer delay on error
+        # Overlap the network round trips within each batch
+        translations = await translate_concurrently(
+            translator, [text for _, text in batch], source_lang, target_lang, concurrency, limiter
+        )
+        cache.update((key, translation) for (key, _), translation in zip(batch, translations))
         
-        translations.extend(batch_translations)
+        # Persist each batch so an interrupted run can resume; failed validations go to the negative cache
+        valid = [is_valid_translation(key, translation) for (key, _), translation in zip(batch, translations)]
+        put_many([(text_hash(key), t) for (key, _), t, ok in zip(batch, translations, valid) if ok], target_lang)
+        mark_untranslatable([text_hash(key) for (key, _), t, ok in zip(batch, translations, valid) if t and not ok], target_lang)
         
         # Progress update
-        logging.info(f"Translated batch {i//batch_size + 1}/{(len(texts)-1)//batch_size + 1}")
-        
-        # Longer delay between batches
-        if i + batch_size < len(texts):
-            time.sleep(1)
+        logging.info(f"Translated batch {i//batch_size + 1}/{(len(pending)-1)//batch_size + 1}")
     
-    return translations
+    return [cache.get(key, '') for key in keys]
 
-def fill_english_translations(df, limit=None):
-    """Fill missing English translations"""
+async def fill_english_translations(df, limit=None, missing_en_mask=None):
+    """Fill missing English translations, updating df in place"""
 
     # Initialize translator
     translator = Translator()
 
     # Find entries that need translation
-    missing_en_mask = analyze_missing_english(df)
-    entries_to_translate = df[missing_en_mask].copy()
+    if missing_en_mask is None:
+        missing_en_mask = analyze_missing_english(df)
+    entries_to_translate = df[missing_en_mask]
 
     # Apply limit if specified
     if limit and len(entries_to_translate) > limit:
@@ -97,36 +132,28 @@ def fill_english_translations(df, limit=None):
 
     logging.info(f"Starting translation of {len(entries_to_translate)} entries...")
 
-    # Prepare texts for translation
-    texts_to_translate = []
-    for _, row in entries_to_translate.iterrows():
-        # Prefer formal_id over id for translation
-        if pd.notna(row['formal_id']) and str(row['formal_id']).strip():
-            text = str(row['formal_id']).strip()
-        elif pd.notna(row['id']) and str(row['id']).strip():
-            text = str(row['id']).strip()
-        else:
-            text = ''
-        texts_to_translate.append(text)
-
-    # Translate in batches
-    try:
-        translations = translate_batch(texts_to_translate, translator, batch_size=20)
+    # Prepare texts for translation, preferring formal_id over id
+    texts_to_translate = source_text(entries_to_translate).tolist()
 
-        # Update the dataframe
-        df_updated = df.copy()
-        translation_idx = 0
-
-        for idx in entries_to_translate.index:
-            if translation_idx < len(translations) and translations[translation_idx]:
-                df_updated.at[idx, 'en'] = translations[translation_idx]
-            translation_idx += 1
+    # Exact dictionary matches need no API call; translate the rest in batches
+    try:
+        dict_translations = [INDONESIAN_ENGLISH_DICT.get(text.lower()) for text in texts_to_translate]
+        logging.info(f"{sum(t is not None for t in dict_translations)} entries translated from the dictionary")
+        google_translations = iter(await translate_batch(
+            [text for text, t in zip(texts_to_translate, dict_translations) if t is None], translator, batch_size=20
+        ))
+        translations = [t if t is not None else next(google_translations) for t in dict_translations]
+
+        # Update the dataframe in one assignment
+        updates = {idx: translation for idx, translation in zip(entries_to_translate.index, translations) if translation}
+        if updates:
+            df.loc[list(updates.keys()), 'en'] = list(updates.values())
 
         # Count successful translations
         successful_translations = sum(1 for t in translations if t and t.strip())
         logging.info(f"Successfully translated {successful_translations} entries")
 
-        return df_updated
+        return df
 
     except Exception as e:
         logging.error(f"Translation process failed: {e}")
@@ -135,29 +162,30 @@ def fill_english_translations(df, limit=None):
 def clean_translations(df):
     """Clean and validate translations"""
     
+    # Normalize once; every check below and the stored value use the same form
+    en_norm = df['en'].str.strip().str.lower()
+    
     # Remove very long translations (likely errors)
-    long_translations = df['en'].str.len() > 50
+    long_translations = en_norm.str.len() > 50
     if long_translations.any():
         logging.info(f"Removing {long_translations.sum()} overly long translations")
-        df.loc[long_translations, 'en'] = ''
     
     # Remove translations that are identical to source (translation failed)
-    for idx, row in df.iterrows():
-        if pd.notna(row['en']) and pd.notna(row['id']):
-            if str(row['en']).strip().lower() == str(row['id']).strip().lower():
-                df.at[idx, 'en'] = ''
+    same_as_source = df['id'].notna() & (en_norm == df['id'].astype(str).str.strip().str.lower())
     
-    # Convert to lowercase for consistency
-    df['en'] = df['en'].str.lower().str.strip()
+    # Keep the lowercase, stripped form for consistency
+    df['en'] = en_norm.mask(long_translations | same_as_source, '')
     
     return df
 
-def create_translation_summary(original_df, translated_df):
-    """Create summary of translation process"""
+def create_translation_summary(original_en, translated_df):
+    """Create summary of translation process from the English column before translation"""
     
     # Count translations
-    original_en_count = (original_df['en'].notna() & (original_df['en'] != '')).sum()
-    final_en_count = (translated_df['en'].notna() & (translated_df['en'] != '')).sum()
+    had_en = non_empty(original_en)
+    has_en = non_empty(translated_df['en'])
+    original_en_count = had_en.sum()
+    final_en_count = has_en.sum()
     new_translations = final_en_count - original_en_count
     
     summary = f"""
@@ -168,19 +196,19 @@ Translation Results:
 - Original English entries: {original_en_count}
 - Final English entries: {final_en_count}
 - New translations added: {new_translations}
-- Translation success rate: {(new_translations / (len(original_df) - original_en_count) * 100):.1f}%
+- Translation success rate: {(new_translations / (len(original_en) - original_en_count) * 100):.1f}%
 
 Dataset Completeness:
 - Total entries: {len(translated_df)}
 - English coverage: {(final_en_count / len(translated_df) * 100):.1f}%
-- Indonesian coverage: {((translated_df['id'].notna() & (translated_df['id'] != '')).sum() / len(translated_df) * 100):.1f}%
-- Formal Indonesian coverage: {((translated_df['formal_id'].notna() & (translated_df['formal_id'] != '')).sum() / len(translated_df) * 100):.1f}%
+- Indonesian coverage: {(non_empty(translated_df['id']).sum() / len(translated_df) * 100):.1f}%
+- Formal Indonesian coverage: {(non_empty(translated_df['formal_id']).sum() / len(translated_df) * 100):.1f}%
 
 Sample New Translations:
 """
     
     # Show sample translations
-    new_translations_mask = (original_df['en'].isna() | (original_df['en'] == '')) & (translated_df['en'].notna() & (translated_df['en'] != ''))
+    new_translations_mask = ~had_en & has_en
     sample_translations = translated_df[new_translations_mask].head(20)
     
     for i, (_, row) in enumerate(sample_translations.iterrows(), 1):
@@ -211,8 +239,8 @@ def main():
     if df is None:
         return
 
-    # Keep original for comparison
-    original_df = df.copy()
+    # Keep original English column for comparison
+    original_en = df['en'].copy()
 
     # For testing, let's start with first 100 entries that need translation
     missing_en_mask = analyze_missing_english(df)
@@ -222,18 +250,19 @@ def main():
 
     # Fill English translations for test entries only (limit to 100)
     logging.info("Starting translation process...")
-    translated_df = fill_english_translations(df, limit=100)
+    # Run the coroutine here, so async callers can await fill_english_translations themselves
+    translated_df = asyncio.run(fill_english_translations(df, limit=100, missing_en_mask=missing_en_mask))
 
     # Clean translations
     logging.info("Cleaning translations...")
     translated_df = clean_translations(translated_df)
 
     # Save updated dataset
-    translated_df.to_csv('multilingual_stopwords_translated_test.csv', index=False)
+    translated_df.to_csv('multilingual_stopwords_translated_test.csv', index=False, chunksize=10000)
     logging.info("Saved translated dataset as multilingual_stopwords_translated_test.csv")
 
     # Create and save summary
-    summary = create_translation_summary(original_df, translated_df)
+    summary = create_translation_summary(original_en, translated_df)
 
     with open('translation_summary_test.txt', 'w', encoding='utf-8') as f:
         f.write(summary)
@@ -4,18 +4,28 @@ Efficient script to translate Indonesian stopwords to English using Google Trans
 """
 
 import pandas as pd
-import time
+import asyncio
 import logging
 from googletrans import Translator
+from cache import text_hash, get_cached, put_many, mark_untranslatable, known_untranslatable
+from rate_limiter import RateLimiter
+from dict_translate import INDONESIAN_ENGLISH_DICT
+from translation_utils import non_empty, needs_translation_mask, source_text, is_valid_translation
 import sys
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Text columns are read as strings so numeric-looking words are not inferred as numbers
+TEXT_DTYPES = {'en': str, 'id': str, 'jv': str, 'su': str, 'formal_id': str}
+
+# Translations made during this run, keyed by normalized Indonesian text
+_MEMO = {}
+
 def load_dataset():
     """Load the multilingual stopwords dataset"""
     try:
-        df = pd.read_csv('multilingual_stopwords_final.csv')
+        df = pd.read_csv('multilingual_stopwords_final.csv', dtype=TEXT_DTYPES)
         logging.info(f"Loaded dataset with {len(df)} entries")
         return df
     except FileNotFoundError:
@@ -25,62 +35,134 @@ def load_dataset():
 def get_translation_candidates(df):
     """Get entries that need English translation"""
     
-    # Find entries missing English
-    missing_en = (df['en'].isna() | (df['en'] == ''))
-    
-    # Find entries that have Indonesian text
-    has_indonesian = (df['id'].notna() & (df['id'] != '')) | (df['formal_id'].notna() & (df['formal_id'] != ''))
+    # Get entries missing English that have Indonesian text
+    candidates = df[needs_translation_mask(df)].copy()
     
-    # Get candidates
-    candidates = df[missing_en & has_indonesian].copy()
-    
-    # Prepare translation text
-    candidates['text_to_translate'] = candidates.apply(
-        lambda row: str(row['formal_id']).strip() if pd.notna(row['formal_id']) and str(row['formal_id']).strip() 
-                   else str(row['id']).strip() if pd.notna(row['id']) and str(row['id']).strip() 
-                   else '', axis=1
-    )
+    # Prepare translation text, preferring formal_id over id
+    candidates['text_to_translate'] = source_text(candidates)
     
     # Remove empty texts
     candidates = candidates[candidates['text_to_translate'] != '']
     
+    # Texts Google recently failed to translate are not retried yet
+    hashes = candidates['text_to_translate'].map(text_hash)
+    candidates = candidates[~hashes.isin(known_untranslatable(hashes))]
+    
+    # Exact dictionary matches need no API call
+    candidates['en_dict'] = candidates['text_to_translate'].str.lower().map(INDONESIAN_ENGLISH_DICT)
+    
     logging.info(f"Found {len(candidates)} entries needing translation")
     return candidates
 
-def translate_chunk(texts, translator, chunk_size=10):
-    """Translate a chunk of texts with error handling"""
-    
-    translations = []
+def translate_joined(translator, texts, limiter):
+    """Translate several short texts in one request, one text per line"""
+    
+    limiter.acquire()
+    result = translator.translate('\n'.join(text.strip() for text in texts), src='id', dest='en')
+    lines = result.text.split('\n')
+    if len(lines) != len(texts):
+        raise ValueError(f"expected {len(texts)} lines, got {len(lines)}")
+    return [line.lower().strip() for line in lines]
+
+def group_texts(texts, group_size=50, max_chars=4000):
+    """Split texts into groups small enough for a single request"""
+    
+    groups = []
+    chars = 0
+    for text in texts:
+        if not groups or len(groups[-1]) == group_size or chars + len(text) + 1 > max_chars:
+            groups.append([])
+            chars = 0
+        groups[-1].append(text)
+        chars += len(text) + 1
+    return groups
+
+def translate_single(translator, text, limiter):
+    """Translate one text in its own request"""
     
-    for i, text in enumerate(texts):
-        try:
-            if text and text.strip():
-                result = translator.translate(text.strip(), src='id', dest='en')
-                translation = result.text.lower().strip()
-                
-                # Basic validation
-                if len(translation) > 50:  # Too long, likely error
-                    translation = ''
-                elif translation == text.lower():  # Translation failed
-                    translation = ''
-                
-                translations.append(translation)
-                logging.info(f"  {i+1}/{len(texts)}: {text} -> {translation}")
-            else:
-                translations.append('')
+    limiter.acquire()
+    return translator.translate(text.strip(), src='id', dest='en').text.lower().strip()
+
+async def translate_groups(texts, translator, limiter, concurrency=8, group_size=50):
+    """Translate texts concurrently in newline-joined groups, returning '' for failures"""
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def translate_one(i, text):
+        async with semaphore:
+            try:
+                # googletrans is synchronous, so each request runs in a worker thread
+                translation = await asyncio.to_thread(translate_single, translator, text, limiter)
+                logging.debug("  %d/%d: %s -> %s", i + 1, len(texts), text, translation)
+                return translation
                 
-            # Rate limiting
-            time.sleep(0.3)
-            
-        except Exception as e:
-            logging.warning(f"Translation failed for '{text}': {e}")
-            translations.append('')
-            time.sleep(1)  # Longer delay on error
+            except Exception as e:
+                logging.warning(f"Translation failed for '{text}': {e}")
+                return ''
+    
+    async def translate_group(start, group):
+        async with semaphore:
+            try:
+                translations = await asyncio.to_thread(translate_joined, translator, group, limiter)
+            except Exception as e:
+                logging.warning(f"Grouped translation of {len(group)} texts failed, retrying one by one: {e}")
+                translations = None
+        
+        if translations is None:
+            return [await translate_one(start + j, text) for j, text in enumerate(group)]
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for j, (text, translation) in enumerate(zip(group, translations)):
+                logging.debug("  %d/%d: %s -> %s", start + j + 1, len(texts), text, translation)
+        return translations
+    
+    groups = group_texts(texts, group_size)
+    starts = [0]
+    for group in groups[:-1]:
+        starts.append(starts[-1] + len(group))
+    results = await asyncio.gather(*(translate_group(start, group) for start, group in zip(starts, groups)))
+    return [translation for translations in results for translation in translations]
+
+async def translate_chunk(texts, translator, chunk_size=10, cache=None, concurrency=8, limiter=None):
+    """Translate a chunk of texts with error handling, calling the API once per unique text"""
+    
+    if cache is None:
+        cache = _MEMO
+    if limiter is None:
+        limiter = RateLimiter()
+    
+    keys = [text.strip().lower() if text else '' for text in texts]
+    pending = {}
+    
+    for text, key in zip(texts, keys):
+        # Repeated tokens are answered from the cache
+        if not key or key in cache or key in pending:
+            continue
+        cached = get_cached(text_hash(key))
+        if cached is not None:
+            cache[key] = cached
+        else:
+            pending[key] = text
+    
+    if pending:
+        translations = await translate_groups(list(pending.values()), translator, limiter, concurrency)
+        cache.update(zip(pending, translations))
+        
+        # Keep good translations; remember texts whose result failed validation
+        valid = [is_valid_translation(key, translation) for key, translation in zip(pending, translations)]
+        put_many([(text_hash(key), t) for key, t, ok in zip(pending, translations, valid) if ok])
+        mark_untranslatable([text_hash(key) for key, t, ok in zip(pending, translations, valid) if t and not ok])
+    
+    translations = []
+    for text, key in zip(texts, keys):
+        translation = cache.get(key, '')
+        
+        # Basic validation
+        translations.append(translation if is_valid_translation(key, translation) else '')
     
     return translations
 
-def process_translations(df, batch_size=50, max_entries=None):
-    """Process translations in batches"""
+async def process_translations(df, batch_size=50, max_entries=None, rps=5):
+    """Process translations in batches, updating df in place"""
     
     # Get candidates
     candidates = get_translation_candidates(df)
@@ -97,10 +179,16 @@ def process_translations(df, batch_size=50, max_entries=None):
     # Initialize translator
     translator = Translator()
     
-    # Process in batches
-    df_updated = df.copy()
-    total_translated = 0
+    # The request budget is shared across batches
+    limiter = RateLimiter(rps)
     
+    # Dictionary matches are written directly, only the rest go to Google
+    in_dict = candidates['en_dict'].notna()
+    updates = {idx: translation for idx, translation in candidates.loc[in_dict, 'en_dict'].items() if translation}
+    logging.info(f"{in_dict.sum()} entries translated from the dictionary")
+    candidates = candidates[~in_dict]
+    
+    # Process in batches; translations are written back to the dataframe in one assignment
     for batch_start in range(0, len(candidates), batch_size):
         batch_end = min(batch_start + batch_size, len(candidates))
         batch = candidates.iloc[batch_start:batch_end]
@@ -109,38 +197,34 @@ def process_translations(df, batch_size=50, max_entries=None):
         
         # Translate batch
         texts = batch['text_to_translate'].tolist()
-        translations = translate_chunk(texts, translator)
+        translations = await translate_chunk(texts, translator, limiter=limiter)
         
-        # Update dataframe
-        for i, (idx, row) in enumerate(batch.iterrows()):
-            if i < len(translations) and translations[i]:
-                df_updated.at[idx, 'en'] = translations[i]
-                total_translated += 1
+        updates.update((idx, translation) for idx, translation in zip(batch.index, translations) if translation)
         
         # Progress update
-        logging.info(f"Batch complete. Total translated so far: {total_translated}")
-        
-        # Longer delay between batches
-        if batch_end < len(candidates):
-            logging.info("Waiting 3 seconds before next batch...")
-            time.sleep(3)
+        logging.info(f"Batch complete. Total translated so far: {len(updates)}")
     
+    if updates:
+        df.loc[list(updates.keys()), 'en'] = list(updates.values())
+    total_translated = len(updates)
     logging.info(f"Translation complete! Total translated: {total_translated}")
-    return df_updated
+    return df
 
-def create_summary(original_df, translated_df):
-    """Create translation summary"""
+def create_summary(original_en, translated_df):
+    """Create translation summary from the English column before translation"""
     
-    original_en = (original_df['en'].notna() & (original_df['en'] != '')).sum()
-    final_en = (translated_df['en'].notna() & (translated_df['en'] != '')).sum()
-    new_translations = final_en - original_en
+    had_en = non_empty(original_en)
+    has_en = non_empty(translated_df['en'])
+    original_en_count = had_en.sum()
+    final_en = has_en.sum()
+    new_translations = final_en - original_en_count
     
     summary = f"""
 TRANSLATION SUMMARY
 ==================
 
 Results:
-- Original English entries: {original_en}
+- Original English entries: {original_en_count}
 - Final English entries: {final_en}
 - New translations added: {new_translations}
 - Total dataset entries: {len(translated_df)}
@@ -150,7 +234,7 @@ Sample new translations:
 """
     
     # Show sample new translations
-    new_mask = (original_df['en'].isna() | (original_df['en'] == '')) & (translated_df['en'].notna() & (translated_df['en'] != ''))
+    new_mask = ~had_en & has_en
     samples = translated_df[new_mask].head(20)
     
     for i, (_, row) in enumerate(samples.iterrows(), 1):
@@ -177,26 +261,27 @@ def main():
     if df is None:
         return
     
-    # Keep original for comparison
-    original_df = df.copy()
+    # Keep original English column for comparison
+    original_en = df['en'].copy()
     
     # Process translations
     print(f"Starting translation process...")
     if max_entries:
         print(f"Limited to {max_entries} entries for testing")
     
-    translated_df = process_translations(df, batch_size=20, max_entries=max_entries)
+    # The only event loop of the script; async callers await process_translations directly
+    translated_df = asyncio.run(process_translations(df, batch_size=20, max_entries=max_entries))
     
     # Save results
     output_file = 'multilingual_stopwords_translated.csv'
     if max_entries:
         output_file = f'multilingual_stopwords_translated_{max_entries}.csv'
     
-    translated_df.to_csv(output_file, index=False)
+    translated_df.to_csv(output_file, index=False, chunksize=10000)
     logging.info(f"Saved translated dataset as {output_file}")
     
     # Create and save summary
-    summary = create_summary(original_df, translated_df)
+    summary = create_summary(original_en, translated_df)
     
     summary_file = 'translation_summary.txt'
     if max_entries:
@@ -4,131 +4,78 @@ Translate Indonesian stopwords to English using a predefined dictionary + Google
 """
 
 import pandas as pd
+import numpy as np
 import time
 import logging
+import sys
+from multiprocessing import Pool
 from googletrans import Translator
+from cache import text_hash, get_cached, put_cached, mark_untranslatable, known_untranslatable
+from dict_translate import translate_using_dictionary
+from translation_utils import non_empty, candidate_index, source_text, is_valid_translation
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-# Predefined Indonesian to English dictionary for common stopwords
-INDONESIAN_ENGLISH_DICT = {
-    # Pronouns
-    'saya': 'i', 'aku': 'i', 'kamu': 'you', 'anda': 'you', 'dia': 'he', 'ia': 'he',
-    'mereka': 'they', 'kita': 'we', 'kami': 'we', 'kalian': 'you',
-    
-    # Common function words
-    'yang': 'which', 'dengan': 'with', 'untuk': 'for', 'dari': 'from', 'pada': 'on',
-    'dalam': 'in', 'oleh': 'by', 'ke': 'to', 'di': 'at', 'akan': 'will',
-    'sudah': 'already', 'sedang': 'being', 'masih': 'still', 'belum': 'not yet',
-    'tidak': 'not', 'bukan': 'not', 'jangan': 'do not', 'juga': 'also',
-    'hanya': 'only', 'saja': 'just', 'pula': 'also', 'lagi': 'again',
-    
-    # Conjunctions
-    'dan': 'and', 'atau': 'or', 'tetapi': 'but', 'karena': 'because',
-    'jika': 'if', 'ketika': 'when', 'sementara': 'while', 'sebelum': 'before',
-    'sesudah': 'after', 'sampai': 'until', 'sejak': 'since',
-    
-    # Demonstratives
-    'ini': 'this', 'itu': 'that', 'begini': 'like this', 'begitu': 'like that',
-    'demikian': 'thus', 'seperti': 'like', 'sama': 'same',
-    
-    # Question words
-    'apa': 'what', 'siapa': 'who', 'dimana': 'where', 'kemana': 'where to',
-    'kapan': 'when', 'mengapa': 'why', 'kenapa': 'why', 'bagaimana': 'how',
-    'berapa': 'how many', 'mana': 'which',
-    
-    # Adverbs
-    'sangat': 'very', 'banget': 'very', 'sekali': 'very', 'agak': 'quite',
-    'cukup': 'enough', 'terlalu': 'too', 'lebih': 'more', 'paling': 'most',
-    'kurang': 'less', 'hampir': 'almost', 'selalu': 'always', 'sering': 'often',
-    'kadang': 'sometimes', 'jarang': 'rarely', 'pernah': 'ever', 'belum pernah': 'never',
-    
-    # Modal verbs
-    'bisa': 'can', 'dapat': 'can', 'mau': 'want', 'ingin': 'want',
-    'harus': 'must', 'perlu': 'need', 'boleh': 'may', 'seharusnya': 'should',
-    
-    # Common particles
-    'lah': '', 'kah': '', 'pun': '', 'sih': '', 'dong': '', 'kok': '',
-    'deh': '', 'tuh': '', 'nih': '', 'yah': '', 'ya': 'yes',
-    
-    # Common colloquial
-    'gitu': 'like that', 'gini': 'like this', 'kayak': 'like', 'kaya': 'like',
-    'gimana': 'how', 'kenapa': 'why', 'emang': 'indeed', 'memang': 'indeed',
-    'udah': 'already', 'belom': 'not yet', 'lagi': 'again', 'aja': 'just',
-    
-    # Common abbreviations
-    'yg': 'which', 'dgn': 'with', 'utk': 'for', 'dr': 'from', 'pd': 'on',
-    'dlm': 'in', 'krn': 'because', 'jk': 'if', 'jgn': 'do not',
-    'bgt': 'very', 'bngt': 'very', 'gk': 'not', 'ga': 'not', 'tdk': 'not',
-    'tdk': 'not', 'blm': 'not yet', 'sdh': 'already', 'lg': 'again',
-    'sm': 'with', 'sma': 'same', 'kl': 'if', 'klo': 'if', 'kalo': 'if',
-    
-    # Family terms
-    'ayah': 'father', 'ibu': 'mother', 'bapak': 'father', 'mama': 'mother',
-    'papa': 'father', 'kakak': 'sibling', 'adik': 'sibling', 'anak': 'child',
-    
-    # Time words
-    'sekarang': 'now', 'nanti': 'later', 'kemarin': 'yesterday', 'besok': 'tomorrow',
-    'hari': 'day', 'minggu': 'week', 'bulan': 'month', 'tahun': 'year',
-    'jam': 'hour', 'menit': 'minute', 'detik': 'second',
-    
-    # Common expressions
-    'terima kasih': 'thank you', 'maaf': 'sorry', 'permisi': 'excuse me',
-    'selamat': 'congratulations', 'halo': 'hello', 'hai': 'hi',
-    
-    # Laughing expressions
-    'haha': 'haha', 'hehe': 'hehe', 'hihi': 'hihi', 'hoho': 'hoho', 'huhu': 'huhu',
-    'hahaha': 'hahaha', 'hehehe': 'hehehe', 'hahahaha': 'hahahaha',
-    
-    # Common internet slang
-    'wkwk': 'lol', 'wkwkwk': 'lol', 'kwkw': 'lol', 'anjay': 'wow',
-    'mantap': 'great', 'keren': 'cool', 'bagus': 'good', 'jelek': 'bad',
-}
+# Text columns are read as strings so numeric-looking words are not inferred as numbers
+TEXT_DTYPES = {'en': str, 'id': str, 'jv': str, 'su': str, 'formal_id': str}
 
-def translate_using_dictionary(text):
-    """Translate using predefined dictionary"""
-    text_lower = text.lower().strip()
-    
-    # Direct match
-    if text_lower in INDONESIAN_ENGLISH_DICT:
-        return INDONESIAN_ENGLISH_DICT[text_lower]
-    
-    # Check for partial matches (for compound words)
-    for indo_word, eng_word in INDONESIAN_ENGLISH_DICT.items():
-        if indo_word in text_lower and len(indo_word) > 2:
-            return eng_word
-    
-    return None
+# Below this many entries a dictionary pass is faster than starting worker processes
+PARALLEL_MIN_ENTRIES = 200000
 
 def translate_with_google(text, translator, max_retries=2):
-    """Fallback to Google Translate"""
+    """Fallback to Google Translate, checking the on-disk cache first"""
     
-    for attempt in range(max_retries):
+    h = text_hash(text)
+    translation = get_cached(h)
+    
+    # Texts Google recently failed to translate are not retried yet
+    if translation is None and known_untranslatable([h]):
+        return None
+    
+    for attempt in range(max_retries if translation is None else 0):
         try:
             result = translator.translate(text.strip(), src='id', dest='en')
             translation = result.text.lower().strip()
-            
-            # Basic validation
-            if len(translation) > 50 or translation == text.lower():
-                return None
-            
-            return translation
+            if is_valid_translation(text, translation):
+                put_cached(h, 'en', translation)
+            else:
+                mark_untranslatable([h])
+            time.sleep(1)  # Rate limiting
+            break
             
         except Exception as e:
             logging.warning(f"Google Translate attempt {attempt + 1} failed for '{text}': {e}")
             if attempt < max_retries - 1:
                 time.sleep(2)
     
-    return None
+    # Basic validation
+    if translation is None or not is_valid_translation(text, translation):
+        return None
+    
+    return translation
+
+def dict_lookup_worker(item):
+    """Dictionary lookup for one (index, text) pair, run in a worker process"""
+    
+    idx, text = item
+    return idx, translate_using_dictionary(text)
 
-def fill_english_translations(df, use_google=True, max_entries=None):
-    """Fill English translations using dictionary + Google Translate"""
+def dictionary_pass(items, processes=None):
+    """Look up every (index, text) pair in the dictionary, in parallel for large inputs"""
+    
+    if len(items) < PARALLEL_MIN_ENTRIES:
+        return [dict_lookup_worker(item) for item in items]
+    with Pool(processes) as pool:
+        return pool.map(dict_lookup_worker, items, chunksize=500)
+
+def fill_english_translations(df, use_google=True, max_entries=None, index=None):
+    """Fill English translations using dictionary + Google Translate, updating df in place"""
     
     # Get entries that need translation
-    missing_en = (df['en'].isna() | (df['en'] == ''))
-    has_indonesian = (df['id'].notna() & (df['id'] != '')) | (df['formal_id'].notna() & (df['formal_id'] != ''))
-    candidates = df[missing_en & has_indonesian].copy()
+    if index is None:
+        index = candidate_index(df)
+    candidates = df.loc[index]
     
     if max_entries:
         candidates = candidates.head(max_entries)
@@ -142,41 +89,54 @@ def fill_english_translations(df, use_google=True, max_entries=None):
     # Initialize Google Translator if needed
     translator = Translator() if use_google else None
     
-    # Process translations
-    df_updated = df.copy()
+    # Google results keyed by normalized text, so repeated tokens are only looked up once
+    google_cache = {}
+    
+    # Process translations; results are written back to the dataframe in one assignment
+    updates = {}
     dict_translations = 0
     google_translations = 0
     
-    for i, (idx, row) in enumerate(candidates.iterrows()):
-        # Get text to translate
-        if pd.notna(row['formal_id']) and str(row['formal_id']).strip():
-            text = str(row['formal_id']).strip()
-        elif pd.notna(row['id']) and str(row['id']).strip():
-            text = str(row['id']).strip()
-        else:
-            continue
-        
-        print(f"  {i + 1:3d}/{len(candidates)}: '{text}' -> ", end='')
-        
-        # Try dictionary first
-        translation = translate_using_dictionary(text)
-        
+    # Get texts to translate, preferring formal_id over id
+    texts = source_text(candidates)
+    has_text = (texts != '').to_numpy()
+    items = list(zip(candidates.index[has_text], texts[has_text]))
+    positions = np.flatnonzero(has_text).tolist()
+    
+    # Try dictionary first; it needs no network, so all entries are looked up at once
+    dict_results = dictionary_pass(items)
+    
+    # Progress lines are written to stdout 100 at a time
+    lines = []
+    for i, (idx, text), (_, translation) in zip(positions, items, dict_results):
         if translation is not None:
-            df_updated.at[idx, 'en'] = translation
+            updates[idx] = translation
             dict_translations += 1
-            print(f"'{translation}' (dict)")
+            status = f"'{translation}' (dict)"
         elif use_google and translator:
             # Fallback to Google Translate
-            translation = translate_with_google(text, translator)
+            key = text.lower()
+            if key not in google_cache:
+                google_cache[key] = translate_with_google(text, translator)
+            translation = google_cache[key]
             if translation:
-                df_updated.at[idx, 'en'] = translation
+                updates[idx] = translation
                 google_translations += 1
-                print(f"'{translation}' (google)")
-                time.sleep(1)  # Rate limiting
+                status = f"'{translation}' (google)"
             else:
-                print("FAILED")
+                status = "FAILED"
         else:
-            print("SKIPPED")
+            status = "SKIPPED"
+        
+        lines.append(f"  {i + 1:3d}/{len(candidates)}: '{text}' -> {status}\n")
+        if len(lines) == 100:
+            sys.stdout.write(''.join(lines))
+            sys.stdout.flush()
+            lines.clear()
+    sys.stdout.write(''.join(lines))
+    
+    if updates:
+        df.loc[list(updates.keys()), 'en'] = list(updates.values())
     
     total_translations = dict_translations + google_translations
     print(f"\nTranslation complete:")
@@ -184,23 +144,23 @@ def fill_english_translations(df, use_google=True, max_entries=None):
     print(f"  Google translations: {google_translations}")
     print(f"  Total successful: {total_translations}")
     
-    return df_updated, dict_translations, google_translations
+    return df, dict_translations, google_translations
 
 def main():
     """Main function"""
     
     # Load dataset
     try:
-        df = pd.read_csv('multilingual_stopwords_final.csv')
+        df = pd.read_csv('multilingual_stopwords_final.csv', dtype=TEXT_DTYPES)
         print(f"Loaded dataset with {len(df)} entries")
     except FileNotFoundError:
         print("multilingual_stopwords_final.csv not found!")
         return
     
     # Check how many need translation
-    missing_en = (df['en'].isna() | (df['en'] == ''))
-    has_indonesian = (df['id'].notna() & (df['id'] != '')) | (df['formal_id'].notna() & (df['formal_id'] != ''))
-    total_needing = (missing_en & has_indonesian).sum()
+    index = candidate_index(df)
+    total_needing = len(index)
+    original_en = non_empty(df['en']).sum()
     
     print(f"Total entries needing translation: {total_needing}")
     
@@ -213,21 +173,20 @@ def main():
     choice = input("Choose option (1-3): ").strip()
     
     if choice == '1':
-        df_translated, dict_count, google_count = fill_english_translations(df, use_google=False)
+        df_translated, dict_count, google_count = fill_english_translations(df, use_google=False, index=index)
         output_file = 'multilingual_stopwords_dict_only.csv'
     elif choice == '3':
-        df_translated, dict_count, google_count = fill_english_translations(df, use_google=True, max_entries=100)
+        df_translated, dict_count, google_count = fill_english_translations(df, use_google=True, max_entries=100, index=index)
         output_file = 'multilingual_stopwords_test_100.csv'
     else:  # Default to option 2
-        df_translated, dict_count, google_count = fill_english_translations(df, use_google=True)
+        df_translated, dict_count, google_count = fill_english_translations(df, use_google=True, index=index)
         output_file = 'multilingual_stopwords_fully_translated.csv'
     
     # Save results
-    df_translated.to_csv(output_file, index=False)
+    df_translated.to_csv(output_file, index=False, chunksize=10000)
     
     # Show summary
-    original_en = (df['en'].notna() & (df['en'] != '')).sum()
-    final_en = (df_translated['en'].notna() & (df_translated['en'] != '')).sum()
+    final_en = non_empty(df_translated['en']).sum()
     
     print(f"\n=== FINAL SUMMARY ===")
     print(f"Original English entries: {original_en}")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Row selection helpers shared by the translation scripts.
+"""
+
+import numpy as np
+import pandas as pd
+
+def non_empty(column):
+    """Mask of cells that hold a non-empty value"""
+
+    return column.notna() & (column != '')
+
+def needs_translation_mask(df):
+    """Mask of entries missing English that have Indonesian text to translate from"""
+
+    return ~non_empty(df['en']) & (non_empty(df['id']) | non_empty(df['formal_id']))
+
+def candidate_index(df, mask=None):
+    """Index of entries that need translation"""
+
+    return df.index[needs_translation_mask(df) if mask is None else mask]
+
+def source_text(df):
+    """Text to translate for each row: stripped formal_id, else stripped id, else ''"""
+
+    formal = df['formal_id'].astype(str).str.strip()
+    ids = df['id'].astype(str).str.strip()
+    return pd.Series(
+        np.where(
+            df['formal_id'].notna() & (formal != ''), formal,
+            np.where(df['id'].notna() & (ids != ''), ids, '')
+        ),
+        index=df.index
+    )
+
+def is_valid_translation(text, translation):
+    """Check that a translation is neither an echo of the source nor suspiciously long"""
+
+    return bool(translation) and len(translation) <= 50 and translation != text.strip().lower()